@@ -276,7 +276,8 @@ def main():
             "by Python's ThreadPoolExecutor, optimized for I/O-bound tasks. "
             "Set to 1 for strictly sequential processing (useful for debugging or "
             "when processing order matters). Higher values may speed up conversion "
-            "of many small files but won't help with a few large files."
+            "of many small files but won't help with a few large files. "
+            "Also applies to --estimate-tokens."
         ),
     )
 
@@ -837,6 +838,7 @@ def _handle_batch_conversion(args, markitdown: MarkItDown, stream_info):
             all_files_for_estimation,
             cache=cache,
             resumed_files=existing_outputs,
+            max_workers=args.parallel,
         )
 
         # Print summary to stderr
@@ -847,8 +849,7 @@ def _handle_batch_conversion(args, markitdown: MarkItDown, stream_info):
             manifest = _build_token_manifest(token_estimate)
             manifest_path = Path(args.export_manifest)
             manifest_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(manifest_path, "w", encoding="utf-8") as f:
-                json.dump(manifest, f, indent=2)
+            _write_token_manifest(manifest_path, manifest)
             print(f"Token estimate manifest written to {manifest_path}", file=sys.stderr)
 
         # Exit without performing actual conversion
@@ -1024,9 +1025,11 @@ def _build_quality_manifest(result: BatchConversionResult) -> dict:
         else:
             file_entry["quality"] = None
 
-        # Add metadata if available and not empty
-        if item.metadata and not item.metadata.is_empty():
-            file_entry["metadata"] = item.metadata.to_dict()
+        # Add metadata if available and not empty. Peek rather than use
+        # item.metadata, which would create an empty default for every item.
+        metadata = item.result._peek_metadata() if item.result is not None else None
+        if metadata is not None and not metadata.is_empty():
+            file_entry["metadata"] = metadata.to_dict()
         else:
             file_entry["metadata"] = None
 
@@ -1083,6 +1086,24 @@ def _build_token_manifest(token_estimate) -> dict:
     return token_estimate.to_dict()
 
 
+def _write_token_manifest(manifest_path: Path, manifest: dict) -> None:
+    """
+    Write a token estimation manifest as indented JSON.
+
+    Token manifests hold one entry per input file, so orjson is used when it
+    is installed; otherwise the standard library json module is used.
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return
+
+    with open(manifest_path, "wb") as f:
+        f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+
+
 def _handle_output(args, result: DocumentConverterResult):
     """Handle output to stdout or file"""
     if args.output:
@@ -10,6 +10,11 @@ from ._stream_info import StreamInfo
 class DocumentConverterResult:
     """The result of converting a document to Markdown."""
 
+    # Results are created for every conversion and cache hit; slots keep
+    # them small and make the lazy quality/metadata checks plain slot reads.
+    # None marks quality/metadata that were not provided.
+    __slots__ = ("markdown", "title", "_quality", "_metadata", "_metadata_raw")
+
     def __init__(
         self,
         markdown: str,
@@ -34,6 +39,10 @@ class DocumentConverterResult:
         self.title = title
         self._quality = quality
         self._metadata = metadata
+        # Serialized metadata JSON from the conversion cache. It is decoded
+        # into _metadata on first access, so cache hits that only need the
+        # markdown never pay for date parsing.
+        self._metadata_raw: Optional[bytes] = None
 
     @property
     def quality(self) -> "ConversionQuality":
@@ -63,17 +72,37 @@ class DocumentConverterResult:
         Returns a DocumentMetadata object. If no metadata was provided
         during conversion, returns an empty metadata object.
         """
-        if self._metadata is None:
+        metadata = self._peek_metadata()
+        if metadata is None:
             # Lazy import to avoid circular dependencies
             from ._document_metadata import DocumentMetadata
 
-            self._metadata = DocumentMetadata()
-        return self._metadata
+            metadata = self._metadata = DocumentMetadata()
+        return metadata
 
     @metadata.setter
     def metadata(self, value: "DocumentMetadata") -> None:
         """Set the document metadata for this conversion."""
         self._metadata = value
+        self._metadata_raw = None
+
+    def _peek_metadata(self) -> Optional["DocumentMetadata"]:
+        """
+        Return the metadata if any was provided, without creating an empty one.
+
+        Serialized metadata from the cache is materialized here on first use.
+        A corrupt blob is treated as no metadata.
+        """
+        if self._metadata is None and self._metadata_raw is not None:
+            # Lazy import to avoid circular dependencies
+            from ._cache import _decode_metadata_raw
+            from ._document_metadata import DocumentMetadata
+
+            metadata_dict = _decode_metadata_raw(self._metadata_raw)
+            self._metadata_raw = None
+            if metadata_dict is not None:
+                self._metadata = DocumentMetadata.from_dict(metadata_dict)
+        return self._metadata
 
     @property
     def text_content(self) -> str:
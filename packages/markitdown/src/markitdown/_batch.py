@@ -89,8 +89,9 @@ class BatchItemResult:
             result_dict["title"] = self.result.title
             result_dict["quality"] = self.result.quality.to_dict()
             # Only include metadata if it's not empty
-            if self.result._metadata is not None and not self.result._metadata.is_empty():
-                result_dict["metadata"] = self.result.metadata.to_dict()
+            metadata = self.result._peek_metadata()
+            if metadata is not None and not metadata.is_empty():
+                result_dict["metadata"] = metadata.to_dict()
         if self.error is not None:
             result_dict["error"] = self.error
             result_dict["error_type"] = self.error_type
@@ -5,8 +5,9 @@
 """
 Caching module for MarkItDown batch conversions.
 
-Provides file-based caching to skip re-conversion of unchanged files.
+Provides persistent caching to skip re-conversion of unchanged files.
 Cache keys are based on file content hash (SHA-256) to detect changes.
+Entries are stored in a single SQLite database inside the cache directory.
 
 ## Why SHA-256 Content Hashing?
 
@@ -54,27 +55,36 @@ consideration. Here's why:
    - Large enough to make collisions astronomically unlikely
    - Good balance between storage efficiency and uniqueness
 
-### Cache File Integrity
+### Why a single SQLite database (not one file per entry)?
 
-Cache files are written with read-only permissions (0o444) after creation.
-This provides several benefits:
-1. Prevents accidental modification of cached data
-2. Signals to users/tools that these files are managed by the cache system
-3. Helps detect corruption (if a cache file is somehow modified, permissions
-   would likely need to be changed first)
+Earlier versions wrote one read-only JSON file per entry under two-level
+`<hash[:2]>/<hash>.json` directories. For batches of thousands of small files
+the per-entry open()/close() and directory traversal dominated cache cost.
+A single SQLite database gives:
+1. One file handle for all lookups, served from the OS page cache
+2. B-tree lookups by hash instead of filesystem path resolution
+3. Safe concurrent access from threads and processes (WAL journal mode)
 
-Note: The cache system itself can still clear/update cache files by removing
-the old file and creating a new one (which is the intended behavior).
+Legacy JSON entries are not read, but clear() still removes them.
 """
 
 import hashlib
 import json
-import os
+import sqlite3
 import stat
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
+# orjson is an optional accelerator. Its output is plain UTF-8 JSON, so the
+# quality and metadata blobs in the database decode the same with the stdlib
+# json fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from ._base_converter import DocumentConverterResult
     from ._conversion_quality import ConversionQuality
@@ -83,29 +93,49 @@ if TYPE_CHECKING:
 # Default cache directory
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "markitdown"
 
-# File permissions for cache files (read-only for all)
-# This prevents accidental modification and signals these are managed files
-CACHE_FILE_PERMISSIONS = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH  # 0o444
+# Name of the SQLite database file inside the cache directory
+CACHE_DB_FILENAME = "cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    file_hash TEXT PRIMARY KEY,
+    markdown TEXT NOT NULL,
+    title TEXT,
+    quality BLOB,
+    metadata BLOB
+)
+"""
 
 
 @dataclass
 class CacheEntry:
-    """A cached conversion result."""
+    """
+    A cached conversion result.
+
+    Entries read from the database keep their metadata as the stored JSON
+    bytes in _metadata_raw rather than decoding it into metadata_dict.
+    cache_entry_to_result() hands those bytes to the result, which only
+    decodes them if .metadata is accessed.
+    """
 
     file_hash: str
     markdown: str
     title: Optional[str]
     quality_dict: Optional[Dict[str, Any]]
     metadata_dict: Optional[Dict[str, Any]] = None
+    _metadata_raw: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to a dictionary for serialization."""
+        metadata_dict = self.metadata_dict
+        if metadata_dict is None and self._metadata_raw is not None:
+            metadata_dict = _decode_metadata_raw(self._metadata_raw)
         return {
             "file_hash": self.file_hash,
             "markdown": self.markdown,
             "title": self.title,
             "quality_dict": self.quality_dict,
-            "metadata_dict": self.metadata_dict,
+            "metadata_dict": metadata_dict,
         }
 
     @classmethod
@@ -122,7 +152,7 @@ class CacheEntry:
 
 class ConversionCache:
     """
-    File-based cache for conversion results.
+    Persistent cache for conversion results.
 
     Uses SHA-256 hash of file contents as cache key. If the file content
     hasn't changed (same hash), the cached markdown result is returned
@@ -130,10 +160,10 @@ class ConversionCache:
 
     Cache Structure:
         cache_dir/
-            <first 2 chars of hash>/
-                <full hash>.json
+            cache.db    (SQLite database, one row per file hash)
 
-    This two-level structure prevents having too many files in a single directory.
+    Quality and metadata dictionaries are stored as JSON blobs. A single
+    connection is shared by all threads and serialized with a lock.
     """
 
     def __init__(self, cache_dir: Optional[Path] = None):
@@ -141,23 +171,41 @@ class ConversionCache:
         Initialize the cache.
 
         Args:
-            cache_dir: Directory to store cache files. Defaults to ~/.cache/markitdown
+            cache_dir: Directory to store the cache database. Defaults to ~/.cache/markitdown
         """
         self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.db_path = self.cache_dir / CACHE_DB_FILENAME
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
         self._ensure_cache_dir()
 
     def _ensure_cache_dir(self) -> None:
         """Create cache directory if it doesn't exist."""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _get_cache_path(self, file_hash: str) -> Path:
+    def _get_connection(self) -> sqlite3.Connection:
         """
-        Get the cache file path for a given hash.
+        Open the cache database on first use. Must be called with _lock held.
 
-        Uses first 2 characters as subdirectory to avoid too many files in one dir.
+        WAL mode lets readers proceed while another process writes, and
+        synchronous=NORMAL avoids an fsync per committed entry.
         """
-        subdir = file_hash[:2]
-        return self.cache_dir / subdir / f"{file_hash}.json"
+        if self._connection is None:
+            connection = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection. It is reopened on next use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
     @staticmethod
     def compute_file_hash(file_path: str) -> str:
@@ -201,24 +249,29 @@ class ConversionCache:
             # Compute current file hash
             current_hash = self.compute_file_hash(file_path)
 
-            # Check if cache file exists
-            cache_path = self._get_cache_path(current_hash)
-            if not cache_path.exists():
+            with self._lock:
+                row = (
+                    self._get_connection()
+                    .execute(
+                        "SELECT markdown, title, quality, metadata"
+                        " FROM entries WHERE file_hash = ?",
+                        (current_hash,),
+                    )
+                    .fetchone()
+                )
+            if row is None:
                 return None
 
-            # Load and validate cache entry
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            entry = CacheEntry.from_dict(data)
-
-            # Verify hash matches (double-check)
-            if entry.file_hash != current_hash:
-                return None
-
-            return entry
+            markdown, title, quality_raw, metadata_raw = row
+            return CacheEntry(
+                file_hash=current_hash,
+                markdown=markdown,
+                title=title,
+                quality_dict=_json_loads(quality_raw) if quality_raw else None,
+                _metadata_raw=metadata_raw or None,
+            )
 
-        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        except (OSError, sqlite3.Error, ValueError, TypeError):
             # Any error reading cache - treat as cache miss
             return None
 
@@ -230,13 +283,7 @@ class ConversionCache:
         """
         Store a conversion result in the cache.
 
-        The cache file is written with read-only permissions (0o444) to:
-        1. Prevent accidental modification
-        2. Signal that these files are managed by the cache system
-        3. Provide basic integrity protection
-
-        If a cache file already exists (e.g., from a previous run), it will be
-        removed first since it's read-only and can't be overwritten directly.
+        An existing entry for the same content hash is replaced.
 
         Args:
             file_path: Path to the source file.
@@ -247,48 +294,30 @@ class ConversionCache:
             # (see module docstring for why we use this approach)
             file_hash = self.compute_file_hash(file_path)
 
-            # Create cache entry with all conversion data
-            quality_dict = None
+            quality_raw = None
             if result._quality is not None:
-                quality_dict = result.quality.to_dict()
-
-            metadata_dict = None
-            if result._metadata is not None and not result._metadata.is_empty():
-                metadata_dict = result.metadata.to_dict()
-
-            entry = CacheEntry(
-                file_hash=file_hash,
-                markdown=result.markdown,
-                title=result.title,
-                quality_dict=quality_dict,
-                metadata_dict=metadata_dict,
-            )
-
-            # Ensure subdirectory exists (using first 2 chars of hash)
-            cache_path = self._get_cache_path(file_hash)
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Remove existing cache file if present (it's read-only so can't overwrite)
-            if cache_path.exists():
-                try:
-                    # Make it writable first so we can delete it
-                    cache_path.chmod(stat.S_IWUSR | stat.S_IRUSR)
-                    cache_path.unlink()
-                except OSError:
-                    pass
-
-            # Write cache file
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(entry.to_dict(), f, ensure_ascii=False)
-
-            # Make the cache file read-only to prevent accidental modification
-            # This is a deliberate design choice - see module docstring
-            try:
-                cache_path.chmod(CACHE_FILE_PERMISSIONS)
-            except OSError:
-                pass  # Best effort - some filesystems don't support chmod
-
-        except (OSError, TypeError):
+                quality_raw = _json_dumps(result.quality.to_dict())
+
+            metadata_raw = None
+            metadata = result._peek_metadata()
+            if metadata is not None and not metadata.is_empty():
+                metadata_raw = _json_dumps(metadata.to_dict())
+
+            with self._lock:
+                self._get_connection().execute(
+                    "INSERT OR REPLACE INTO entries"
+                    " (file_hash, markdown, title, quality, metadata)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (
+                        file_hash,
+                        result.markdown,
+                        result.title,
+                        quality_raw,
+                        metadata_raw,
+                    ),
+                )
+
+        except (OSError, sqlite3.Error, TypeError):
             # Silently fail on cache write errors - caching is optional
             pass
 
@@ -308,19 +337,33 @@ class ConversionCache:
         """
         Clear all cached entries.
 
-        Cache files are read-only, so this method makes them writable
-        before deleting them.
+        Also removes per-entry JSON files left behind by older versions of the
+        cache. Those files are read-only, so they are made writable first.
 
         Returns:
             Number of cache entries removed.
         """
         count = 0
+        if self.db_path.exists():
+            try:
+                with self._lock:
+                    count += (
+                        self._get_connection().execute("DELETE FROM entries").rowcount
+                    )
+            except sqlite3.Error:
+                pass
+        count += self._clear_legacy_entries()
+        return count
+
+    def _clear_legacy_entries(self) -> int:
+        """Remove legacy <hash[:2]>/<hash>.json cache files."""
+        count = 0
         if self.cache_dir.exists():
             for subdir in self.cache_dir.iterdir():
                 if subdir.is_dir():
                     for cache_file in subdir.glob("*.json"):
                         try:
-                            # Make writable first (cache files are read-only)
+                            # Make writable first (legacy cache files are read-only)
                             cache_file.chmod(stat.S_IWUSR | stat.S_IRUSR)
                             cache_file.unlink()
                             count += 1
@@ -343,15 +386,26 @@ class ConversionCache:
         entry_count = 0
         total_size = 0
 
-        if self.cache_dir.exists():
-            for subdir in self.cache_dir.iterdir():
-                if subdir.is_dir():
-                    for cache_file in subdir.glob("*.json"):
-                        entry_count += 1
-                        try:
-                            total_size += cache_file.stat().st_size
-                        except OSError:
-                            pass
+        if self.db_path.exists():
+            try:
+                with self._lock:
+                    entry_count = (
+                        self._get_connection()
+                        .execute("SELECT COUNT(*) FROM entries")
+                        .fetchone()[0]
+                    )
+            except sqlite3.Error:
+                pass
+
+            # Include the write-ahead log, which holds recent writes
+            for path in (
+                self.db_path,
+                self.db_path.with_name(CACHE_DB_FILENAME + "-wal"),
+            ):
+                try:
+                    total_size += path.stat().st_size
+                except OSError:
+                    pass
 
         return {
             "entry_count": entry_count,
@@ -360,6 +414,34 @@ class ConversionCache:
         }
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _decode_metadata_raw(data: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Decode a cached metadata blob, or return None if it is corrupt.
+
+    Metadata is decoded lazily, after get() has already reported a hit, so a
+    damaged blob is treated as missing metadata rather than raising.
+    """
+    try:
+        metadata_dict = _json_loads(data)
+    except ValueError:
+        return None
+    return metadata_dict if isinstance(metadata_dict, dict) else None
+
+
 def cache_entry_to_result(entry: CacheEntry) -> "DocumentConverterResult":
     """
     Convert a CacheEntry back to a DocumentConverterResult.
@@ -381,14 +463,18 @@ def cache_entry_to_result(entry: CacheEntry) -> "DocumentConverterResult":
         # Mark that this result came from cache
         quality.set_metric("from_cache", True)
 
-    # Reconstruct metadata if present
+    # Reconstruct metadata if present. Serialized metadata is left for the
+    # result to decode on first access.
     metadata = None
     if entry.metadata_dict is not None:
         metadata = DocumentMetadata.from_dict(entry.metadata_dict)
 
-    return DocumentConverterResult(
+    result = DocumentConverterResult(
         markdown=entry.markdown,
         title=entry.title,
         quality=quality,
         metadata=metadata,
     )
+    if metadata is None:
+        result._metadata_raw = entry._metadata_raw
+    return result
@@ -37,7 +37,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     """
     Metadata extracted from a document during conversion.
@@ -103,16 +103,14 @@ class DocumentMetadata:
         Datetime objects are converted to ISO 8601 format strings.
         None values are omitted from the output to keep it clean.
         """
+        # Fields are written out one by one rather than looping over
+        # dataclasses.fields(); this runs for every cache write and manifest.
         result: Dict[str, Any] = {}
 
         if self.title is not None:
             result["title"] = self.title
         if self.author is not None:
             result["author"] = self.author
-        if self.date_created is not None:
-            result["date_created"] = self.date_created.isoformat()
-        if self.date_modified is not None:
-            result["date_modified"] = self.date_modified.isoformat()
         if self.language is not None:
             result["language"] = self.language
         if self.page_count is not None:
@@ -123,7 +121,11 @@ class DocumentMetadata:
             result["character_count"] = self.character_count
         if self.description is not None:
             result["description"] = self.description
-        if self.keywords is not None and len(self.keywords) > 0:
+        if self.date_created is not None:
+            result["date_created"] = self.date_created.isoformat()
+        if self.date_modified is not None:
+            result["date_modified"] = self.date_modified.isoformat()
+        if self.keywords:
             result["keywords"] = self.keywords
         if self.custom:
             result["custom"] = self.custom
@@ -135,40 +137,30 @@ class DocumentMetadata:
         """
         Create a DocumentMetadata from a dictionary.
 
+        This is called for every cache hit, so it bypasses the generated
+        __init__ and assigns the slots directly.
+
         Args:
             data: Dictionary representation (as produced by to_dict()).
 
         Returns:
             A new DocumentMetadata instance.
         """
+        get = data.get
+        self = object.__new__(cls)
+        self.title = get("title")
+        self.author = get("author")
         # Parse datetime strings back to datetime objects
-        date_created = None
-        if data.get("date_created"):
-            try:
-                date_created = datetime.fromisoformat(data["date_created"])
-            except (ValueError, TypeError):
-                pass
-
-        date_modified = None
-        if data.get("date_modified"):
-            try:
-                date_modified = datetime.fromisoformat(data["date_modified"])
-            except (ValueError, TypeError):
-                pass
-
-        return cls(
-            title=data.get("title"),
-            author=data.get("author"),
-            date_created=date_created,
-            date_modified=date_modified,
-            language=data.get("language"),
-            page_count=data.get("page_count"),
-            word_count=data.get("word_count"),
-            character_count=data.get("character_count"),
-            description=data.get("description"),
-            keywords=data.get("keywords"),
-            custom=data.get("custom", {}),
-        )
+        self.date_created = _parse_iso_datetime(get("date_created"))
+        self.date_modified = _parse_iso_datetime(get("date_modified"))
+        self.language = get("language")
+        self.page_count = get("page_count")
+        self.word_count = get("word_count")
+        self.character_count = get("character_count")
+        self.description = get("description")
+        self.keywords = get("keywords")
+        self.custom = get("custom") or {}
+        return self
 
     def is_empty(self) -> bool:
         """Check if all metadata fields are empty/None."""
@@ -307,3 +299,13 @@ class DocumentMetadata:
             return "No metadata available"
 
         return "\n".join(lines)
+
+
+def _parse_iso_datetime(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 string produced by to_dict(), or return None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
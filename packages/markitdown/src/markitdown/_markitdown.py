@@ -5,6 +5,7 @@ import sys
 import shutil
 import traceback
 import io
+import warnings
 from dataclasses import dataclass
 from importlib.metadata import entry_points
 from typing import Any, Callable, List, Dict, Optional, Union, BinaryIO, TYPE_CHECKING
@@ -76,6 +77,23 @@ PRIORITY_GENERIC_FILE_FORMAT = (
 _plugins: Union[None, List[Any]] = None  # If None, plugins have not been loaded yet.
 
 
+def _warning_is_ignored(category: type) -> bool:
+    """
+    Check whether the active warning filters would discard `category`.
+
+    Only unconditional filters (no message, module or line restriction) are
+    considered; anything more specific is treated as "not ignored" so the
+    caller still emits the warning and lets the warnings machinery decide.
+    """
+    for action, message, filter_category, module, lineno in warnings.filters:
+        if not issubclass(category, filter_category):
+            continue
+        if message is None and module is None and lineno == 0:
+            return action == "ignore"
+        return False
+    return False
+
+
 def _load_plugins() -> Union[None, List[Any]]:
     """Lazy load plugins, exiting early if already loaded."""
     global _plugins
@@ -781,6 +799,12 @@ class MarkItDown:
                             # - File type info (extension, mimetype) for context
                             # - Exception type and message
                             # - Traceback for debugging (abbreviated to last 3 frames)
+                            #
+                            # Formatting the traceback is by far the most expensive
+                            # part, so skip it when RuntimeWarnings are ignored.
+                            if _warning_is_ignored(RuntimeWarning):
+                                return res
+
                             source_id = (
                                 stream_info.filename
                                 or stream_info.local_path
@@ -22,17 +22,57 @@ Design principles:
     - Extraction failures are silently handled and never interrupt conversion
     - Stream position is always restored after extraction
     - Word/character counts are computed from the converted markdown as fallback
+    - Format backends (pdfminer, BeautifulSoup, zipfile, ElementTree) are imported
+      inside the extractor that needs them, so they are only loaded once a
+      matching file type is actually seen. Keep module-level imports stdlib-light.
 
 The main entry point is extract_metadata(), which dispatches to format-specific
 extractors based on file extension or MIME type.
 """
 
 from datetime import datetime
-from typing import Any, BinaryIO, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
 
 from ._document_metadata import DocumentMetadata
 from ._stream_info import StreamInfo
 
+# Fallback formats for _parse_iso_date(), tried in order when
+# datetime.fromisoformat() rejects the input (e.g., "2024-01" or "2024").
+_ISO_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%d",
+    "%Y-%m",
+    "%Y",
+)
+
+# Namespaces used in Office Open XML property parts
+_OFFICE_NS = {
+    "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "ep": "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties",
+}
+
+# Local tag name -> DocumentMetadata field for elements in docProps/core.xml
+_OFFICE_CORE_TAGS = {
+    "title": "title",
+    "creator": "author",
+    "subject": "description",
+    "keywords": "keywords",
+    "language": "language",
+    "created": "date_created",
+    "modified": "date_modified",
+}
+
+# (element path, DocumentMetadata field) pairs read from docProps/app.xml
+_OFFICE_APP_FIELDS = {
+    ".docx": (("ep:Pages", "page_count"), ("ep:Words", "word_count")),
+    ".pptx": (("ep:Slides", "page_count"), ("ep:Words", "word_count")),
+}
+
 
 def extract_metadata(
     file_stream: BinaryIO,
@@ -78,27 +118,22 @@ def extract_metadata(
     """
     metadata = DocumentMetadata()
 
-    # Get extension and mimetype for dispatcher
-    extension = (stream_info.extension or "").lower()
-    mimetype = (stream_info.mimetype or "").lower()
+    # Select the format-specific extractor (if any)
+    extractor = _get_extractor(stream_info)
+
+    # Without an extractor only the markdown counts are available, and they
+    # never touch the stream
+    if extractor is None:
+        if result_markdown:
+            metadata.word_count = _count_words(result_markdown)
+            metadata.character_count = _count_characters(result_markdown)
+        return metadata
 
     # Save stream position
     cur_pos = file_stream.tell()
 
     try:
-        # Try format-specific extractors
-        if extension in [".pdf"] or mimetype.startswith("application/pdf"):
-            metadata = _extract_pdf_metadata(file_stream)
-        elif extension in [".docx"] or "wordprocessingml" in mimetype:
-            metadata = _extract_docx_metadata(file_stream)
-        elif extension in [".xlsx"] or "spreadsheetml" in mimetype:
-            metadata = _extract_xlsx_metadata(file_stream)
-        elif extension in [".pptx"] or "presentationml" in mimetype:
-            metadata = _extract_pptx_metadata(file_stream)
-        elif extension in [".html", ".htm"] or mimetype.startswith("text/html"):
-            metadata = _extract_html_metadata(file_stream, stream_info)
-        elif extension in [".epub"]:
-            metadata = _extract_epub_metadata(file_stream)
+        metadata = extractor(file_stream, stream_info)
 
         # Compute word count and character count from markdown if not already set
         if result_markdown:
@@ -118,6 +153,29 @@ def extract_metadata(
     return metadata
 
 
+def _get_extractor(
+    stream_info: StreamInfo,
+) -> Optional[Callable[[BinaryIO, StreamInfo], DocumentMetadata]]:
+    """
+    Look up the format-specific extractor for a stream.
+
+    The extension is resolved with a single dict lookup. The MIME type is
+    only consulted when the extension is missing or unrecognized.
+    """
+    extension = (stream_info.extension or "").lower()
+    extractor = _EXTRACTORS_BY_EXTENSION.get(extension)
+    if extractor is not None:
+        return extractor
+
+    mimetype = (stream_info.mimetype or "").lower()
+    if not mimetype:
+        return None
+    for mimetype_match, mimetype_extractor in _EXTRACTORS_BY_MIMETYPE:
+        if mimetype_match(mimetype):
+            return mimetype_extractor
+    return None
+
+
 def _count_words(text: str) -> int:
     """
     Count words in text.
@@ -171,7 +229,9 @@ def _count_characters(text: str) -> int:
     return sum(1 for char in text if not char.isspace())
 
 
-def _extract_pdf_metadata(file_stream: BinaryIO) -> DocumentMetadata:
+def _extract_pdf_metadata(
+    file_stream: BinaryIO, stream_info: StreamInfo
+) -> DocumentMetadata:
     """Extract metadata from a PDF file using pdfminer."""
     metadata = DocumentMetadata()
 
@@ -179,6 +239,7 @@ def _extract_pdf_metadata(file_stream: BinaryIO) -> DocumentMetadata:
         from pdfminer.pdfparser import PDFParser
         from pdfminer.pdfdocument import PDFDocument
         from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdftypes import resolve1
 
         file_stream.seek(0)
         parser = PDFParser(file_stream)
@@ -188,43 +249,12 @@ def _extract_pdf_metadata(file_stream: BinaryIO) -> DocumentMetadata:
         if doc.info:
             info = doc.info[0] if isinstance(doc.info, list) else doc.info
 
-            # Title
-            if b"Title" in info:
-                title = _decode_pdf_string(info[b"Title"])
-                if title:
-                    metadata.title = title
-
-            # Author
-            if b"Author" in info:
-                author = _decode_pdf_string(info[b"Author"])
-                if author:
-                    metadata.author = author
-
-            # Subject/Description
-            if b"Subject" in info:
-                subject = _decode_pdf_string(info[b"Subject"])
-                if subject:
-                    metadata.description = subject
-
-            # Keywords
-            if b"Keywords" in info:
-                keywords_str = _decode_pdf_string(info[b"Keywords"])
-                if keywords_str:
-                    # Keywords are often comma or semicolon separated
-                    keywords = [k.strip() for k in keywords_str.replace(";", ",").split(",")]
-                    metadata.keywords = [k for k in keywords if k]
-
-            # Creation date
-            if b"CreationDate" in info:
-                date = _parse_pdf_date(info[b"CreationDate"])
-                if date:
-                    metadata.date_created = date
-
-            # Modification date
-            if b"ModDate" in info:
-                date = _parse_pdf_date(info[b"ModDate"])
-                if date:
-                    metadata.date_modified = date
+            for key, name, transform in _PDF_INFO_FIELDS:
+                raw = info.get(key)
+                if raw is not None:
+                    value = transform(resolve1(raw))
+                    if value:
+                        setattr(metadata, name, value)
 
         # Count pages
         file_stream.seek(0)
@@ -257,6 +287,15 @@ def _decode_pdf_string(value: Any) -> Optional[str]:
     return str(value).strip() if str(value).strip() else None
 
 
+def _parse_pdf_keywords(value: Any) -> Optional[List[str]]:
+    """Split a PDF Keywords string, which is often comma or semicolon separated."""
+    keywords_str = _decode_pdf_string(value)
+    if not keywords_str:
+        return None
+    keywords = [k.strip() for k in keywords_str.replace(";", ",").split(",")]
+    return [k for k in keywords if k]
+
+
 def _parse_pdf_date(value: Any) -> Optional[datetime]:
     """Parse a PDF date string (D:YYYYMMDDHHmmSS format)."""
     try:
@@ -294,149 +333,34 @@ def _parse_pdf_date(value: Any) -> Optional[datetime]:
     return None
 
 
-def _extract_docx_metadata(file_stream: BinaryIO) -> DocumentMetadata:
+def _extract_docx_metadata(
+    file_stream: BinaryIO, stream_info: StreamInfo
+) -> DocumentMetadata:
     """Extract metadata from a DOCX file."""
-    metadata = DocumentMetadata()
-
-    try:
-        from zipfile import ZipFile
-        import xml.etree.ElementTree as ET
+    return _extract_office_metadata(file_stream, ".docx")
 
-        file_stream.seek(0)
-        with ZipFile(file_stream, "r") as zf:
-            # Core properties are in docProps/core.xml
-            if "docProps/core.xml" in zf.namelist():
-                with zf.open("docProps/core.xml") as core_file:
-                    tree = ET.parse(core_file)
-                    root = tree.getroot()
-
-                    # Namespaces used in core.xml
-                    ns = {
-                        "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
-                        "dc": "http://purl.org/dc/elements/1.1/",
-                        "dcterms": "http://purl.org/dc/terms/",
-                    }
-
-                    # Title
-                    title_elem = root.find("dc:title", ns)
-                    if title_elem is not None and title_elem.text:
-                        metadata.title = title_elem.text.strip()
-
-                    # Author/Creator
-                    creator_elem = root.find("dc:creator", ns)
-                    if creator_elem is not None and creator_elem.text:
-                        metadata.author = creator_elem.text.strip()
-
-                    # Description/Subject
-                    subject_elem = root.find("dc:subject", ns)
-                    if subject_elem is not None and subject_elem.text:
-                        metadata.description = subject_elem.text.strip()
-
-                    # Keywords
-                    keywords_elem = root.find("cp:keywords", ns)
-                    if keywords_elem is not None and keywords_elem.text:
-                        keywords = [k.strip() for k in keywords_elem.text.replace(";", ",").split(",")]
-                        metadata.keywords = [k for k in keywords if k]
-
-                    # Language
-                    lang_elem = root.find("dc:language", ns)
-                    if lang_elem is not None and lang_elem.text:
-                        metadata.language = lang_elem.text.strip()
-
-                    # Created date
-                    created_elem = root.find("dcterms:created", ns)
-                    if created_elem is not None and created_elem.text:
-                        metadata.date_created = _parse_iso_date(created_elem.text)
-
-                    # Modified date
-                    modified_elem = root.find("dcterms:modified", ns)
-                    if modified_elem is not None and modified_elem.text:
-                        metadata.date_modified = _parse_iso_date(modified_elem.text)
-
-            # App properties are in docProps/app.xml (for page count)
-            if "docProps/app.xml" in zf.namelist():
-                with zf.open("docProps/app.xml") as app_file:
-                    tree = ET.parse(app_file)
-                    root = tree.getroot()
-
-                    ns = {
-                        "ep": "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
-                    }
-
-                    # Page count
-                    pages_elem = root.find("ep:Pages", ns)
-                    if pages_elem is not None and pages_elem.text:
-                        try:
-                            metadata.page_count = int(pages_elem.text)
-                        except ValueError:
-                            pass
 
-                    # Word count (from app.xml is more accurate than counting)
-                    words_elem = root.find("ep:Words", ns)
-                    if words_elem is not None and words_elem.text:
-                        try:
-                            metadata.word_count = int(words_elem.text)
-                        except ValueError:
-                            pass
+def _extract_xlsx_metadata(
+    file_stream: BinaryIO, stream_info: StreamInfo
+) -> DocumentMetadata:
+    """Extract metadata from an XLSX file."""
+    return _extract_office_metadata(file_stream, ".xlsx")
 
-    except Exception:
-        pass
 
-    return metadata
+def _extract_pptx_metadata(
+    file_stream: BinaryIO, stream_info: StreamInfo
+) -> DocumentMetadata:
+    """Extract metadata from a PPTX file."""
+    return _extract_office_metadata(file_stream, ".pptx")
 
 
-def _extract_xlsx_metadata(file_stream: BinaryIO) -> DocumentMetadata:
-    """Extract metadata from an XLSX file."""
+def _extract_office_metadata(file_stream: BinaryIO, extension: str) -> DocumentMetadata:
+    """Extract metadata from an Office Open XML file (DOCX, XLSX, PPTX)."""
     metadata = DocumentMetadata()
 
     try:
-        from zipfile import ZipFile
-        import xml.etree.ElementTree as ET
-
-        file_stream.seek(0)
-        with ZipFile(file_stream, "r") as zf:
-            # Core properties
-            if "docProps/core.xml" in zf.namelist():
-                with zf.open("docProps/core.xml") as core_file:
-                    tree = ET.parse(core_file)
-                    root = tree.getroot()
-
-                    ns = {
-                        "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
-                        "dc": "http://purl.org/dc/elements/1.1/",
-                        "dcterms": "http://purl.org/dc/terms/",
-                    }
-
-                    # Title
-                    title_elem = root.find("dc:title", ns)
-                    if title_elem is not None and title_elem.text:
-                        metadata.title = title_elem.text.strip()
-
-                    # Author
-                    creator_elem = root.find("dc:creator", ns)
-                    if creator_elem is not None and creator_elem.text:
-                        metadata.author = creator_elem.text.strip()
-
-                    # Description
-                    subject_elem = root.find("dc:subject", ns)
-                    if subject_elem is not None and subject_elem.text:
-                        metadata.description = subject_elem.text.strip()
-
-                    # Keywords
-                    keywords_elem = root.find("cp:keywords", ns)
-                    if keywords_elem is not None and keywords_elem.text:
-                        keywords = [k.strip() for k in keywords_elem.text.replace(";", ",").split(",")]
-                        metadata.keywords = [k for k in keywords if k]
-
-                    # Created
-                    created_elem = root.find("dcterms:created", ns)
-                    if created_elem is not None and created_elem.text:
-                        metadata.date_created = _parse_iso_date(created_elem.text)
-
-                    # Modified
-                    modified_elem = root.find("dcterms:modified", ns)
-                    if modified_elem is not None and modified_elem.text:
-                        metadata.date_modified = _parse_iso_date(modified_elem.text)
+        for name, value in _read_office_properties(file_stream, extension).items():
+            setattr(metadata, name, value)
 
     except Exception:
         pass
@@ -444,92 +368,64 @@ def _extract_xlsx_metadata(file_stream: BinaryIO) -> DocumentMetadata:
     return metadata
 
 
-def _extract_pptx_metadata(file_stream: BinaryIO) -> DocumentMetadata:
-    """Extract metadata from a PPTX file."""
-    metadata = DocumentMetadata()
-
-    try:
-        from zipfile import ZipFile
-        import xml.etree.ElementTree as ET
-
-        file_stream.seek(0)
-        with ZipFile(file_stream, "r") as zf:
-            # Core properties
-            if "docProps/core.xml" in zf.namelist():
-                with zf.open("docProps/core.xml") as core_file:
-                    tree = ET.parse(core_file)
-                    root = tree.getroot()
-
-                    ns = {
-                        "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
-                        "dc": "http://purl.org/dc/elements/1.1/",
-                        "dcterms": "http://purl.org/dc/terms/",
-                    }
+def _read_office_properties(file_stream: BinaryIO, extension: str) -> Dict[str, Any]:
+    """
+    Read document properties from docProps/core.xml and docProps/app.xml.
 
-                    # Title
-                    title_elem = root.find("dc:title", ns)
-                    if title_elem is not None and title_elem.text:
-                        metadata.title = title_elem.text.strip()
-
-                    # Author
-                    creator_elem = root.find("dc:creator", ns)
-                    if creator_elem is not None and creator_elem.text:
-                        metadata.author = creator_elem.text.strip()
-
-                    # Description
-                    subject_elem = root.find("dc:subject", ns)
-                    if subject_elem is not None and subject_elem.text:
-                        metadata.description = subject_elem.text.strip()
-
-                    # Keywords
-                    keywords_elem = root.find("cp:keywords", ns)
-                    if keywords_elem is not None and keywords_elem.text:
-                        keywords = [k.strip() for k in keywords_elem.text.replace(";", ",").split(",")]
-                        metadata.keywords = [k for k in keywords if k]
-
-                    # Created
-                    created_elem = root.find("dcterms:created", ns)
-                    if created_elem is not None and created_elem.text:
-                        metadata.date_created = _parse_iso_date(created_elem.text)
-
-                    # Modified
-                    modified_elem = root.find("dcterms:modified", ns)
-                    if modified_elem is not None and modified_elem.text:
-                        metadata.date_modified = _parse_iso_date(modified_elem.text)
-
-            # App properties for slide count
-            if "docProps/app.xml" in zf.namelist():
-                with zf.open("docProps/app.xml") as app_file:
-                    tree = ET.parse(app_file)
-                    root = tree.getroot()
+    Returns a dict mapping DocumentMetadata field names to values.
+    """
+    from zipfile import ZipFile
+    import xml.etree.ElementTree as ET
 
-                    ns = {
-                        "ep": "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
-                    }
+    properties: Dict[str, Any] = {}
 
-                    # Slide count (use as page_count)
-                    slides_elem = root.find("ep:Slides", ns)
-                    if slides_elem is not None and slides_elem.text:
-                        try:
-                            metadata.page_count = int(slides_elem.text)
-                        except ValueError:
-                            pass
+    file_stream.seek(0)
+    with ZipFile(file_stream, "r") as zf:
+        # Core properties are in docProps/core.xml. The part is only a few
+        # KB, so one read plus fromstring() beats a chunked streaming parse.
+        try:
+            core_root = ET.fromstring(zf.read("docProps/core.xml"))
+        except KeyError:
+            core_root = None
+
+        if core_root is not None:
+            for elem in core_root:
+                name = _OFFICE_CORE_TAGS.get(elem.tag.rpartition("}")[2])
+                text = elem.text
+                if name is None or not text or name in properties:
+                    continue
 
-                    # Word count
-                    words_elem = root.find("ep:Words", ns)
-                    if words_elem is not None and words_elem.text:
+                if name == "keywords":
+                    keywords = [k.strip() for k in text.replace(";", ",").split(",")]
+                    properties[name] = [k for k in keywords if k]
+                elif name in ("date_created", "date_modified"):
+                    properties[name] = _parse_iso_date(text)
+                else:
+                    properties[name] = text.strip()
+
+        # App properties are in docProps/app.xml (page/slide and word counts)
+        app_fields = _OFFICE_APP_FIELDS.get(extension)
+        if app_fields:
+            try:
+                app_root = ET.fromstring(zf.read("docProps/app.xml"))
+            except KeyError:
+                app_root = None
+
+            if app_root is not None:
+                for path, name in app_fields:
+                    elem = app_root.find(path, _OFFICE_NS)
+                    if elem is not None and elem.text:
                         try:
-                            metadata.word_count = int(words_elem.text)
+                            properties[name] = int(elem.text)
                         except ValueError:
                             pass
 
-    except Exception:
-        pass
-
-    return metadata
+    return properties
 
 
-def _extract_html_metadata(file_stream: BinaryIO, stream_info: StreamInfo) -> DocumentMetadata:
+def _extract_html_metadata(
+    file_stream: BinaryIO, stream_info: StreamInfo
+) -> DocumentMetadata:
     """Extract metadata from an HTML file."""
     metadata = DocumentMetadata()
 
@@ -575,7 +471,9 @@ def _extract_html_metadata(file_stream: BinaryIO, stream_info: StreamInfo) -> Do
     return metadata
 
 
-def _extract_epub_metadata(file_stream: BinaryIO) -> DocumentMetadata:
+def _extract_epub_metadata(
+    file_stream: BinaryIO, stream_info: StreamInfo
+) -> DocumentMetadata:
     """Extract metadata from an EPUB file."""
     metadata = DocumentMetadata()
 
@@ -613,30 +511,12 @@ def _extract_epub_metadata(file_stream: BinaryIO) -> DocumentMetadata:
                         metadata_elem = root.find("metadata")
 
                     if metadata_elem is not None:
-                        # Title
-                        title_elem = metadata_elem.find("dc:title", ns)
-                        if title_elem is not None and title_elem.text:
-                            metadata.title = title_elem.text.strip()
-
-                        # Author
-                        creator_elem = metadata_elem.find("dc:creator", ns)
-                        if creator_elem is not None and creator_elem.text:
-                            metadata.author = creator_elem.text.strip()
-
-                        # Description
-                        desc_elem = metadata_elem.find("dc:description", ns)
-                        if desc_elem is not None and desc_elem.text:
-                            metadata.description = desc_elem.text.strip()
-
-                        # Language
-                        lang_elem = metadata_elem.find("dc:language", ns)
-                        if lang_elem is not None and lang_elem.text:
-                            metadata.language = lang_elem.text.strip()
-
-                        # Date
-                        date_elem = metadata_elem.find("dc:date", ns)
-                        if date_elem is not None and date_elem.text:
-                            metadata.date_created = _parse_iso_date(date_elem.text)
+                        for path, name, transform in _EPUB_DC_FIELDS:
+                            elem = metadata_elem.find(path, ns)
+                            if elem is not None and elem.text:
+                                value = transform(elem.text)
+                                if value:
+                                    setattr(metadata, name, value)
 
                         # Subject (as keywords)
                         subjects = metadata_elem.findall("dc:subject", ns)
@@ -652,22 +532,29 @@ def _extract_epub_metadata(file_stream: BinaryIO) -> DocumentMetadata:
 
 
 def _parse_iso_date(date_str: str) -> Optional[datetime]:
-    """Parse an ISO 8601 date string."""
+    """
+    Parse an ISO 8601 date string.
+
+    datetime.fromisoformat() (implemented in C) handles the common forms found
+    in document properties, including timezone offsets. Only strings it rejects
+    fall back to the slower strptime() loop over _ISO_DATE_FORMATS.
+    Timezone information is stripped; the local time is kept as-is.
+    """
     if not date_str:
         return None
 
     date_str = date_str.strip()
+    if not date_str:
+        return None
 
-    # Try various ISO formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%Y-%m-%d",
-        "%Y-%m",
-        "%Y",
-    ]
+    # Fast path: fromisoformat() does not accept a trailing "Z" before 3.11
+    try:
+        parsed = datetime.fromisoformat(
+            date_str[:-1] if date_str.endswith("Z") else date_str
+        )
+        return parsed.replace(tzinfo=None)
+    except ValueError:
+        pass
 
     # Handle timezone offset (e.g., +00:00 or -05:00)
     if "+" in date_str[10:] or (date_str.count("-") > 2 and "-" in date_str[10:]):
@@ -677,10 +564,50 @@ def _parse_iso_date(date_str: str) -> Optional[datetime]:
                 date_str = date_str[:10] + date_str[10:].split(sep)[0]
                 break
 
-    for fmt in formats:
+    for fmt in _ISO_DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
 
     return None
+
+
+# (info dictionary key, DocumentMetadata field, transform) for PDF documents
+_PDF_INFO_FIELDS = (
+    ("Title", "title", _decode_pdf_string),
+    ("Author", "author", _decode_pdf_string),
+    ("Subject", "description", _decode_pdf_string),
+    ("Keywords", "keywords", _parse_pdf_keywords),
+    ("CreationDate", "date_created", _parse_pdf_date),
+    ("ModDate", "date_modified", _parse_pdf_date),
+)
+
+# (Dublin Core element path, DocumentMetadata field, transform) for EPUB
+# package metadata. dc:subject is repeated and handled separately.
+_EPUB_DC_FIELDS = (
+    ("dc:title", "title", str.strip),
+    ("dc:creator", "author", str.strip),
+    ("dc:description", "description", str.strip),
+    ("dc:language", "language", str.strip),
+    ("dc:date", "date_created", _parse_iso_date),
+)
+
+# Extractor dispatch tables used by _get_extractor()
+_EXTRACTORS_BY_EXTENSION = {
+    ".pdf": _extract_pdf_metadata,
+    ".docx": _extract_docx_metadata,
+    ".xlsx": _extract_xlsx_metadata,
+    ".pptx": _extract_pptx_metadata,
+    ".html": _extract_html_metadata,
+    ".htm": _extract_html_metadata,
+    ".epub": _extract_epub_metadata,
+}
+
+_EXTRACTORS_BY_MIMETYPE = (
+    (lambda m: m.startswith("application/pdf"), _extract_pdf_metadata),
+    (lambda m: "wordprocessingml" in m, _extract_docx_metadata),
+    (lambda m: "spreadsheetml" in m, _extract_xlsx_metadata),
+    (lambda m: "presentationml" in m, _extract_pptx_metadata),
+    (lambda m: m.startswith("text/html"), _extract_html_metadata),
+)
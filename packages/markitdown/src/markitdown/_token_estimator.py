@@ -48,8 +48,10 @@ IMPORTANT ASSUMPTIONS AND LIMITATIONS:
    - These accurately reflect that no NEW tokens will be used for these files
 """
 
+import bisect
 import os
 import math
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Union, TYPE_CHECKING
@@ -70,10 +72,20 @@ class FileCategory(Enum):
 
 
 # Image file extensions that use LLM for description
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png"})
 
 # PowerPoint extensions that may use LLM for embedded image descriptions
-PPTX_EXTENSIONS = {".pptx"}
+PPTX_EXTENSIONS = frozenset({".pptx"})
+
+# Extension -> category for files that use the LLM, so estimate_file_tokens()
+# classifies a file with one lookup. Anything else is NO_LLM.
+_EXT_TO_CATEGORY = {
+    **dict.fromkeys(IMAGE_EXTENSIONS, FileCategory.IMAGE),
+    **dict.fromkeys(PPTX_EXTENSIONS, FileCategory.PPTX),
+}
+
+# Default upper bound on threads used by estimate_batch_tokens()
+_ESTIMATE_MAX_WORKERS = 32
 
 # Default prompt token count (the prompt "Write a detailed caption for this image.")
 DEFAULT_PROMPT_TOKENS = 10
@@ -92,10 +104,19 @@ BASE_IMAGE_TOKENS = 85  # Base tokens for any image
 MAX_IMAGE_DIMENSION = 2048  # Max dimension before scaling
 TILE_SIZE = 512  # Tile size for token calculation
 
+# Per-image tokens for images embedded in PPTX files. Embedded images are
+# usually smaller than standalone ones, so assume 2 tiles on average.
+_PPTX_IMAGE_INPUT_TOKENS = BASE_IMAGE_TOKENS + TOKENS_PER_TILE * 2 + DEFAULT_PROMPT_TOKENS
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileTokenEstimate:
-    """Token estimate for a single file."""
+    """
+    Token estimate for a single file.
+
+    Estimates are immutable: estimate_batch_tokens() hands the same instance
+    to every occurrence of a duplicated path.
+    """
 
     source_path: str
     category: FileCategory
@@ -126,7 +147,7 @@ class FileTokenEstimate:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchTokenEstimate:
     """Token estimate for an entire batch conversion."""
 
@@ -174,6 +195,8 @@ class BatchTokenEstimate:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
+        total_input_tokens = self.total_input_tokens
+        total_output_tokens = self.total_output_tokens
         return {
             "summary": {
                 "total_files": len(self.files),
@@ -182,39 +205,49 @@ class BatchTokenEstimate:
                 "cached_files": len(self.cached_files),
                 "resumed_files": len(self.resumed_files),
                 "total_image_count": self.total_image_count,
-                "total_input_tokens": self.total_input_tokens,
-                "total_output_tokens": self.total_output_tokens,
-                "total_tokens": self.total_tokens,
+                "total_input_tokens": total_input_tokens,
+                "total_output_tokens": total_output_tokens,
+                "total_tokens": total_input_tokens + total_output_tokens,
             },
             "files": [f.to_dict() for f in self.files],
         }
 
     def __str__(self) -> str:
         """Return a human-readable summary."""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("TOKEN ESTIMATION SUMMARY")
-        lines.append("=" * 60)
-        lines.append(f"Total files: {len(self.files)}")
-        lines.append(f"  Files using LLM: {len(self.files_using_llm)}")
-        lines.append(f"  Files not using LLM: {len(self.files_skipped)}")
-        if self.cached_files:
-            lines.append(f"    (cached: {len(self.cached_files)})")
-        if self.resumed_files:
-            lines.append(f"    (already converted: {len(self.resumed_files)})")
-        lines.append("")
-        lines.append(f"Total images to process: {self.total_image_count}")
-        lines.append("")
-        lines.append("ESTIMATED TOKEN USAGE:")
-        lines.append(f"  Input tokens:  {self.total_input_tokens:,}")
-        lines.append(f"  Output tokens: {self.total_output_tokens:,}")
-        lines.append(f"  TOTAL TOKENS:  {self.total_tokens:,}")
-
-        if self.files_using_llm:
+        # Each total property is a pass over self.files; compute them once.
+        total_input_tokens = self.total_input_tokens
+        total_output_tokens = self.total_output_tokens
+        files_using_llm = self.files_using_llm
+        cached_files = self.cached_files
+        resumed_files = self.resumed_files
+
+        lines = [
+            "=" * 60,
+            "TOKEN ESTIMATION SUMMARY",
+            "=" * 60,
+            f"Total files: {len(self.files)}",
+            f"  Files using LLM: {len(files_using_llm)}",
+            f"  Files not using LLM: {len(self.files_skipped)}",
+        ]
+        if cached_files:
+            lines.append(f"    (cached: {len(cached_files)})")
+        if resumed_files:
+            lines.append(f"    (already converted: {len(resumed_files)})")
+        lines += [
+            "",
+            f"Total images to process: {self.total_image_count}",
+            "",
+            "ESTIMATED TOKEN USAGE:",
+            f"  Input tokens:  {total_input_tokens:,}",
+            f"  Output tokens: {total_output_tokens:,}",
+            f"  TOTAL TOKENS:  {total_input_tokens + total_output_tokens:,}",
+        ]
+
+        if files_using_llm:
             lines.append("")
             lines.append("Files using LLM tokens:")
             # Sort by total tokens descending to show most expensive first
-            sorted_files = sorted(self.files_using_llm, key=lambda f: f.total_tokens, reverse=True)
+            sorted_files = sorted(files_using_llm, key=lambda f: f.total_tokens, reverse=True)
             for f in sorted_files[:20]:  # Show first 20
                 # Truncate long paths
                 display_path = f.source_path
@@ -228,7 +261,9 @@ class BatchTokenEstimate:
         return "\n".join(lines)
 
 
-def _estimate_image_tokens(file_path: Union[str, Path]) -> int:
+def _estimate_image_tokens(
+    file_path: Union[str, Path], size: Optional[int] = None
+) -> int:
     """
     Estimate the number of input tokens for an image file.
 
@@ -243,15 +278,19 @@ def _estimate_image_tokens(file_path: Union[str, Path]) -> int:
 
     Args:
         file_path: Path to the image file.
+        size: File size in bytes, if already known. Avoids another stat call.
 
     Returns:
         Estimated input tokens for the image.
     """
-    try:
-        file_size = os.path.getsize(file_path)
-    except OSError:
-        # Default estimate if we can't read file size
-        return BASE_IMAGE_TOKENS + TOKENS_PER_TILE * 4  # Assume 4 tiles
+    if size is not None:
+        file_size = size
+    else:
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            # Default estimate if we can't read file size
+            return BASE_IMAGE_TOKENS + TOKENS_PER_TILE * 4  # Assume 4 tiles
 
     # Estimate image dimensions based on file size
     # This is a rough heuristic: larger files typically mean larger/more detailed images
@@ -259,7 +298,7 @@ def _estimate_image_tokens(file_path: Union[str, Path]) -> int:
     # Average PNG compression: ~2-3 bytes per pixel
     # We'll use a middle ground of ~1 byte per pixel
     estimated_pixels = file_size
-    estimated_dimension = int(math.sqrt(estimated_pixels))
+    estimated_dimension = math.isqrt(max(0, estimated_pixels))
 
     # Cap at max dimension
     if estimated_dimension > MAX_IMAGE_DIMENSION:
@@ -274,7 +313,9 @@ def _estimate_image_tokens(file_path: Union[str, Path]) -> int:
     return BASE_IMAGE_TOKENS + (TOKENS_PER_TILE * total_tiles)
 
 
-def _estimate_pptx_image_count(file_path: Union[str, Path]) -> int:
+def _estimate_pptx_image_count(
+    file_path: Union[str, Path], size: Optional[int] = None
+) -> int:
     """
     Estimate the number of images in a PowerPoint file.
 
@@ -292,15 +333,24 @@ def _estimate_pptx_image_count(file_path: Union[str, Path]) -> int:
 
     Args:
         file_path: Path to the PPTX file.
+        size: File size in bytes, if already known. Avoids another stat call.
 
     Returns:
         Estimated number of images in the presentation.
     """
-    try:
-        file_size = os.path.getsize(file_path)
-    except OSError:
-        return 0
+    if size is not None:
+        file_size = size
+    else:
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            return 0
+
+    return bisect.bisect_right(_PPTX_IMAGE_COUNT_THRESHOLDS, file_size)
 
+
+def _pptx_image_count_formula(file_size: int) -> int:
+    """Size-based PPTX image count heuristic; see _estimate_pptx_image_count()."""
     size_mb = file_size / (1024 * 1024)
 
     # Estimation heuristic with logarithmic scaling for large files:
@@ -337,6 +387,32 @@ def _estimate_pptx_image_count(file_path: Union[str, Path]) -> int:
         return max(15, min(25, int(10 + math.log2(size_mb) * 2.5)))
 
 
+def _build_pptx_image_count_thresholds() -> List[int]:
+    """
+    Find the smallest file size for each image count the heuristic produces.
+
+    The heuristic never decreases as the file gets larger, so the image
+    count for a size is the number of thresholds at or below it. This lets
+    _estimate_pptx_image_count() use a bisect instead of sqrt/log2 per file
+    while returning exactly what the formula would.
+    """
+    upper = 1 << 40  # 1 TiB, well past the point where the count is capped
+    thresholds = []
+    for count in range(1, _pptx_image_count_formula(upper) + 1):
+        lo, hi = 0, upper
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _pptx_image_count_formula(mid) >= count:
+                hi = mid
+            else:
+                lo = mid + 1
+        thresholds.append(lo)
+    return thresholds
+
+
+_PPTX_IMAGE_COUNT_THRESHOLDS = _build_pptx_image_count_thresholds()
+
+
 def estimate_file_tokens(
     file_path: Union[str, Path],
     *,
@@ -358,11 +434,13 @@ def estimate_file_tokens(
     source_str = str(file_path)
     extension = file_path.suffix.lower()
 
-    # Check file size
+    # Check file size. A single stat result is shared with the helpers below;
+    # None is passed on if it failed so they apply their own fallbacks.
     try:
-        file_size = os.path.getsize(file_path)
+        size = os.stat(file_path).st_size
     except OSError:
-        file_size = 0
+        size = None
+    file_size = size if size is not None else 0
 
     # Check if file is resumed (output already exists)
     if is_resumed:
@@ -387,9 +465,10 @@ def estimate_file_tokens(
             pass  # Cache check failed, proceed with estimation
 
     # Estimate based on file type
-    if extension in IMAGE_EXTENSIONS:
+    category = _EXT_TO_CATEGORY.get(extension, FileCategory.NO_LLM)
+    if category is FileCategory.IMAGE:
         # Standalone image file
-        image_tokens = _estimate_image_tokens(file_path)
+        image_tokens = _estimate_image_tokens(file_path, size)
         return FileTokenEstimate(
             source_path=source_str,
             category=FileCategory.IMAGE,
@@ -399,14 +478,12 @@ def estimate_file_tokens(
             file_size_bytes=file_size,
         )
 
-    elif extension in PPTX_EXTENSIONS:
+    elif category is FileCategory.PPTX:
         # PowerPoint file with potential embedded images
-        image_count = _estimate_pptx_image_count(file_path)
+        image_count = _estimate_pptx_image_count(file_path, size)
         if image_count > 0:
             # Each image in PPTX gets processed similar to standalone images
-            # Estimate average tokens per embedded image (smaller than standalone)
-            avg_image_tokens = BASE_IMAGE_TOKENS + TOKENS_PER_TILE * 2  # Assume 2 tiles avg
-            total_input = (avg_image_tokens + DEFAULT_PROMPT_TOKENS) * image_count
+            total_input = _PPTX_IMAGE_INPUT_TOKENS * image_count
             total_output = DEFAULT_OUTPUT_TOKENS * image_count
 
             return FileTokenEstimate(
@@ -440,31 +517,52 @@ def estimate_batch_tokens(
     *,
     cache: Optional["ConversionCache"] = None,
     resumed_files: Optional[Dict[str, Path]] = None,
+    max_workers: Optional[int] = None,
 ) -> BatchTokenEstimate:
     """
     Estimate the LLM tokens that will be used for a batch conversion.
 
+    Per-file work is I/O-bound (a stat call, plus hashing the file when a
+    cache is given), so files are estimated on a thread pool. Duplicate
+    paths are estimated once. The order of the returned estimates matches
+    the order of `files`.
+
     Args:
         files: List of file paths to estimate.
         cache: Optional cache to check if files are already cached.
         resumed_files: Optional dict mapping source paths to existing output paths.
+        max_workers: Maximum number of parallel workers. Defaults to
+            min(32, len(files)). Use 1 to estimate sequentially.
 
     Returns:
         BatchTokenEstimate with per-file and total estimates.
     """
     resumed_files = resumed_files or {}
 
-    batch_estimate = BatchTokenEstimate()
-
-    for file_path in files:
-        file_str = str(file_path)
-        is_resumed = file_str in resumed_files
-
-        estimate = estimate_file_tokens(
+    def estimate_single(file_path: Union[str, Path]) -> FileTokenEstimate:
+        return estimate_file_tokens(
             file_path,
             cache=cache,
-            is_resumed=is_resumed,
+            is_resumed=str(file_path) in resumed_files,
         )
-        batch_estimate.files.append(estimate)
 
-    return batch_estimate
+    # A path listed more than once is only stat'ed (and hashed for the cache
+    # lookup) once; every occurrence shares the same estimate.
+    unique_files = list(dict.fromkeys(str(f) for f in files))
+
+    if max_workers is None:
+        max_workers = min(_ESTIMATE_MAX_WORKERS, len(unique_files))
+
+    if max_workers <= 1:
+        estimates = list(map(estimate_single, unique_files))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            estimates = list(executor.map(estimate_single, unique_files))
+
+    # The estimates list becomes the batch's files list as-is; it is only
+    # rebuilt when duplicates have to be expanded back out.
+    if len(unique_files) != len(files):
+        by_path = dict(zip(unique_files, estimates))
+        estimates = [by_path[str(f)] for f in files]
+
+    return BatchTokenEstimate(files=estimates)
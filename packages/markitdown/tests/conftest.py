@@ -0,0 +1,37 @@
+"""Shared pytest configuration for the markitdown test suite."""
+
+import pytest
+
+try:
+    import xdist  # noqa: F401
+except ImportError:
+    # pytest-xdist provides worker_id when installed ("gw0", "gw1", ... or
+    # "master" when not distributing). Mirror it so fixtures can depend on it.
+    @pytest.fixture(scope="session")
+    def worker_id():
+        return "master"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked as slow (skipped by default).",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: stress test that only runs with --run-slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -997,6 +997,46 @@ class TestCacheEdgeCases:
             assert entry.markdown == unicode_markdown
             assert entry.title == "Título"
 
+    def test_cache_blobs_readable_without_orjson(self):
+        """Test cached JSON blobs decode the same whether or not orjson is used."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ConversionCache(Path(tmpdir) / "cache")
+
+            test_file = Path(tmpdir) / "test.txt"
+            test_file.write_text("Content")
+
+            # Write with the stdlib fallback, read back with the default encoder
+            with patch("markitdown._cache.orjson", None):
+                cache.put(str(test_file), DocumentConverterResult(markdown="# 标题"))
+
+            entry = cache.get(str(test_file))
+            assert entry is not None
+            assert entry.markdown == "# 标题"
+
+            # And the other way around
+            cache.put(str(test_file), DocumentConverterResult(markdown="# Título"))
+            with patch("markitdown._cache.orjson", None):
+                entry = cache.get(str(test_file))
+            assert entry is not None
+            assert entry.markdown == "# Título"
+
+    @pytest.mark.parametrize("blob", [b"\xff{", b"{not json"])
+    def test_corrupt_quality_blob_is_cache_miss_without_orjson(self, blob):
+        """Test a corrupt quality blob is a cache miss with the stdlib parser."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ConversionCache(Path(tmpdir) / "cache")
+
+            test_file = Path(tmpdir) / "test.txt"
+            test_file.write_text("Content")
+            cache.put(str(test_file), DocumentConverterResult(markdown="# Test"))
+
+            connection = cache._get_connection()
+            connection.execute("UPDATE entries SET quality = ?", (blob,))
+            connection.commit()
+
+            with patch("markitdown._cache.orjson", None):
+                assert cache.get(str(test_file)) is None
+
     def test_cache_handles_empty_file(self):
         """Test caching handles empty files."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1058,78 +1098,61 @@ class TestCacheEdgeCases:
             assert len(results) == 10
             assert all(success for _, success in results)
 
-    def test_cache_subdirectory_structure(self):
-        """Test cache creates proper subdirectory structure."""
+    def test_cache_uses_single_database(self):
+        """Test cache entries are stored in one SQLite database file."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache_dir = Path(tmpdir) / "cache"
             cache = ConversionCache(cache_dir)
 
-            test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("Content")
-
-            result = DocumentConverterResult(markdown="# Test")
-            cache.put(str(test_file), result)
-
-            # Check subdirectory structure
-            file_hash = cache.compute_file_hash(str(test_file))
-            expected_subdir = cache_dir / file_hash[:2]
-            expected_file = expected_subdir / f"{file_hash}.json"
-
-            assert expected_subdir.exists()
-            assert expected_file.exists()
+            for i in range(3):
+                test_file = Path(tmpdir) / f"test{i}.txt"
+                test_file.write_text(f"Content {i}")
+                cache.put(str(test_file), DocumentConverterResult(markdown=f"# Test {i}"))
 
-    def test_cache_files_are_read_only(self):
-        """Test that cache files are created with read-only permissions."""
-        import stat
+            assert cache.db_path == cache_dir / "cache.db"
+            assert cache.db_path.exists()
+            # No per-entry files or subdirectories are created
+            assert not [p for p in cache_dir.iterdir() if p.is_dir()]
+            assert not list(cache_dir.rglob("*.json"))
+            assert cache.get_stats()["entry_count"] == 3
+            cache.close()
 
+    def test_cache_put_replaces_existing_entry(self):
+        """Test that re-caching the same content replaces the entry."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            cache_dir = Path(tmpdir) / "cache"
-            cache = ConversionCache(cache_dir)
+            cache = ConversionCache(Path(tmpdir) / "cache")
 
             test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("Content for readonly test")
-
-            result = DocumentConverterResult(markdown="# Readonly Test")
-            cache.put(str(test_file), result)
+            test_file.write_text("Content")
 
-            # Find the cache file
-            file_hash = cache.compute_file_hash(str(test_file))
-            cache_path = cache_dir / file_hash[:2] / f"{file_hash}.json"
+            cache.put(str(test_file), DocumentConverterResult(markdown="# Original"))
+            cache.put(str(test_file), DocumentConverterResult(markdown="# Updated"))
 
-            assert cache_path.exists()
+            entry = cache.get(str(test_file))
+            assert entry is not None
+            assert entry.markdown == "# Updated"
+            assert cache.get_stats()["entry_count"] == 1
+            cache.close()
 
-            # Check permissions - should be read-only (0o444)
-            file_mode = cache_path.stat().st_mode
-            # Check that write bits are NOT set
-            assert not (file_mode & stat.S_IWUSR), "User write bit should not be set"
-            assert not (file_mode & stat.S_IWGRP), "Group write bit should not be set"
-            assert not (file_mode & stat.S_IWOTH), "Other write bit should not be set"
-            # Check that read bits ARE set
-            assert file_mode & stat.S_IRUSR, "User read bit should be set"
+    def test_cache_clear_removes_legacy_json_files(self):
+        """Test that clear() removes read-only per-entry files from older versions."""
+        import stat
 
-    def test_cache_readonly_prevents_accidental_write(self):
-        """Test that read-only cache files prevent accidental modification."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache_dir = Path(tmpdir) / "cache"
             cache = ConversionCache(cache_dir)
 
-            test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("Content")
-
-            result = DocumentConverterResult(markdown="# Original")
-            cache.put(str(test_file), result)
-
-            # Find the cache file
-            file_hash = cache.compute_file_hash(str(test_file))
-            cache_path = cache_dir / file_hash[:2] / f"{file_hash}.json"
+            legacy_file = cache_dir / "ab" / ("ab" + "0" * 62 + ".json")
+            legacy_file.parent.mkdir()
+            legacy_file.write_text('{"file_hash": "ab", "markdown": "# Old"}')
+            legacy_file.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
 
-            # Trying to open for write should raise PermissionError
-            with pytest.raises(PermissionError):
-                with open(cache_path, "w") as f:
-                    f.write("Modified content")
+            assert cache.clear() == 1
+            assert not legacy_file.exists()
+            assert not legacy_file.parent.exists()
 
-    def test_cache_clear_handles_readonly_files(self):
-        """Test that cache.clear() properly handles read-only files."""
+    def test_cache_clear_removes_all_rows(self):
+        """Test that cache.clear() deletes every entry row and reports the count."""
         with tempfile.TemporaryDirectory() as tmpdir:
             cache_dir = Path(tmpdir) / "cache"
             cache = ConversionCache(cache_dir)
@@ -1144,7 +1167,6 @@ class TestCacheEdgeCases:
             # Verify they're cached
             assert cache.get_stats()["entry_count"] == 3
 
-            # Clear should handle read-only files
             count = cache.clear()
             assert count == 3
             assert cache.get_stats()["entry_count"] == 0
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3 -m pytest
 """Tests for the DocumentMetadata feature."""
 
+import dataclasses
+import gc
 import io
 import os
 import tempfile
@@ -26,10 +28,131 @@ from markitdown._metadata_extractor import (
     _parse_iso_date,
 )
 from markitdown._stream_info import StreamInfo
+from markitdown import _cache as _cache_module
 from markitdown._cache import CacheEntry, cache_entry_to_result
 
 TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
 
+# Oversized field values for the edge-case tests, built once per session
+_LARGE_DESC = "x" * 10000
+_MANY_KEYWORDS = tuple(map("keyword{}".format, range(1000)))
+
+# Contents of the shared batch input file
+_BATCH_BYTES = b"Test content for batch"
+
+# Unusual field values that must survive serialization unchanged
+_ROUNDTRIP_EDGE_CASES = [
+    pytest.param(
+        dict(
+            title="文档标题",
+            author="作者名",
+            description="日本語の説明",
+            keywords=["한국어", "العربية", "emoji 🎉"],
+        ),
+        id="unicode",
+    ),
+    pytest.param(
+        dict(
+            title="Title with \"quotes\" and 'apostrophes'",
+            description="Line1\nLine2\tTabbed",
+            keywords=["back\\slash", "forward/slash"],
+        ),
+        id="special_characters",
+    ),
+    pytest.param(
+        dict(
+            description=_LARGE_DESC,
+            keywords=list(_MANY_KEYWORDS),
+            word_count=10000000,
+            character_count=50000000,
+        ),
+        id="large_values",
+        marks=pytest.mark.slow,
+    ),
+    pytest.param(
+        dict(
+            # Very old date and future date
+            date_created=datetime(1900, 1, 1, 0, 0, 0),
+            date_modified=datetime(2100, 12, 31, 23, 59, 59),
+        ),
+        id="date_boundaries",
+    ),
+]
+
+
+def _write(path: Path, data: bytes) -> None:
+    """Write a small test payload with a single write(2), skipping io layers."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="module")
+def full_metadata():
+    """A DocumentMetadata with every field populated. Do not mutate."""
+    now = datetime(2024, 1, 15, 10, 30, 0)
+    return DocumentMetadata(
+        title="Test",
+        author="Author",
+        date_created=now,
+        date_modified=now,
+        language="en",
+        page_count=5,
+        word_count=1000,
+        character_count=5000,
+        description="Description",
+        keywords=["a", "b"],
+        custom={"extra": "data"},
+    )
+
+
+@pytest.fixture
+def no_gc():
+    """Suspend the cyclic garbage collector for allocation-heavy tests."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    yield
+    if was_enabled:
+        gc.enable()
+
+
+@pytest.fixture
+def sample_metadata():
+    """A small DocumentMetadata to attach to results."""
+    return DocumentMetadata(title="Sample", word_count=100)
+
+
+@pytest.fixture(scope="module")
+def markitdown():
+    """A MarkItDown instance shared by the module. Converters are stateless."""
+    return MarkItDown()
+
+
+@pytest.fixture(scope="module")
+def tmp_root(tmp_path_factory):
+    """A scratch directory shared by the module. Name files after the test."""
+    return tmp_path_factory.mktemp("md_batch")
+
+
+@pytest.fixture(scope="module")
+def txt_file(tmp_root):
+    """A small text file for read-only conversion tests. Do not modify."""
+    path = tmp_root / "shared.txt"
+    _write(path, _BATCH_BYTES)
+    return path
+
+
+@pytest.fixture(scope="session")
+def shared_cache(tmp_path_factory, worker_id):
+    """
+    A ConversionCache shared by the session. Entries are keyed by content, so
+    tests must write content no other test uses. Each pytest-xdist worker
+    gets its own cache, so the module can run with -n auto.
+    """
+    return ConversionCache(tmp_path_factory.mktemp(f"cache-{worker_id}"))
+
 
 class TestDocumentMetadata:
     """Tests for DocumentMetadata dataclass."""
@@ -99,22 +222,9 @@ class TestDocumentMetadata:
         metadata4 = DocumentMetadata(keywords=[])
         assert metadata4.is_empty()
 
-    def test_metadata_to_dict(self):
+    def test_metadata_to_dict(self, full_metadata):
         """Test metadata serialization to dict."""
-        now = datetime(2024, 1, 15, 10, 30, 0)
-        metadata = DocumentMetadata(
-            title="Test",
-            author="Author",
-            date_created=now,
-            date_modified=now,
-            language="en",
-            page_count=5,
-            word_count=1000,
-            character_count=5000,
-            description="Description",
-            keywords=["a", "b"],
-            custom={"extra": "data"},
-        )
+        metadata = full_metadata
 
         d = metadata.to_dict()
 
@@ -203,20 +313,13 @@ class TestDocumentMetadata:
         assert metadata.date_created is None  # Invalid, should be None
         assert metadata.date_modified is None
 
-    def test_metadata_roundtrip(self):
+    def test_metadata_roundtrip(self, full_metadata):
         """Test complete roundtrip through to_dict and from_dict."""
-        now = datetime(2024, 6, 15, 12, 0, 0)
-        original = DocumentMetadata(
-            title="Complete Document",
-            author="Test Author",
-            date_created=now,
-            date_modified=now,
+        original = dataclasses.replace(
+            full_metadata,
+            date_created=datetime(2024, 6, 15, 12, 0, 0),
+            date_modified=datetime(2024, 6, 15, 12, 0, 0),
             language="fr-FR",
-            page_count=100,
-            word_count=50000,
-            character_count=250000,
-            description="A complete test document",
-            keywords=["test", "complete", "metadata"],
             custom={"source": "test", "version": 2},
         )
 
@@ -224,17 +327,8 @@ class TestDocumentMetadata:
         data = original.to_dict()
         restored = DocumentMetadata.from_dict(data)
 
-        assert restored.title == original.title
-        assert restored.author == original.author
-        assert restored.date_created == original.date_created
-        assert restored.date_modified == original.date_modified
-        assert restored.language == original.language
-        assert restored.page_count == original.page_count
-        assert restored.word_count == original.word_count
-        assert restored.character_count == original.character_count
-        assert restored.description == original.description
-        assert restored.keywords == original.keywords
-        assert restored.custom == original.custom
+        # Dataclass equality compares every field
+        assert restored == original
 
     def test_metadata_str_representation(self):
         """Test string representation of metadata."""
@@ -275,6 +369,21 @@ class TestDocumentMetadataDateHelpers:
         metadata = DocumentMetadata()
         assert metadata.get_date_created_iso() is None
 
+    def test_get_date_created_iso_tracks_reassignment(self):
+        """Test the ISO string follows a reassigned date."""
+        metadata = DocumentMetadata(date_created=datetime(2024, 1, 15, 10, 30, 45))
+        assert metadata.get_date_created_iso() == "2024-01-15T10:30:45"
+
+        metadata.date_created = datetime(2025, 2, 1, 8, 0, 0)
+        assert metadata.get_date_created_iso() == "2025-02-01T08:00:00"
+        assert metadata.to_dict()["date_created"] == "2025-02-01T08:00:00"
+
+    def test_asdict_exposes_only_public_fields(self):
+        """Test dataclasses.asdict() only returns the documented fields."""
+        metadata = DocumentMetadata(date_created=datetime(2024, 1, 15))
+
+        assert not any(name.startswith("_") for name in dataclasses.asdict(metadata))
+
     def test_get_date_modified_iso(self):
         """Test get_date_modified_iso helper."""
         dt = datetime(2024, 3, 20, 14, 0, 0)
@@ -478,6 +587,16 @@ class TestMetadataExtraction:
         assert metadata.word_count == 4
         assert metadata.character_count is not None
 
+    def test_extract_metadata_unknown_format_skips_stream(self):
+        """Test formats without an extractor never read the stream."""
+        stream = MagicMock()
+        stream_info = StreamInfo(extension=".unknown")
+
+        metadata = extract_metadata(stream, stream_info, "Some text")
+
+        assert metadata.word_count == 2
+        assert stream.method_calls == []
+
 
 class TestMetadataExtractionFromRealFiles:
     """Tests for metadata extraction from real test files."""
@@ -486,10 +605,9 @@ class TestMetadataExtractionFromRealFiles:
         not os.path.exists(os.path.join(TEST_FILES_DIR, "test.docx")),
         reason="Test file not found"
     )
-    def test_extract_docx_metadata(self):
+    def test_extract_docx_metadata(self, markitdown):
         """Test extracting metadata from a DOCX file."""
         docx_path = os.path.join(TEST_FILES_DIR, "test.docx")
-        markitdown = MarkItDown()
 
         result = markitdown.convert(docx_path)
 
@@ -506,10 +624,9 @@ class TestMetadataExtractionFromRealFiles:
         not os.path.exists(os.path.join(TEST_FILES_DIR, "test.pdf")),
         reason="Test file not found"
     )
-    def test_extract_pdf_metadata(self):
+    def test_extract_pdf_metadata(self, markitdown):
         """Test extracting metadata from a PDF file."""
         pdf_path = os.path.join(TEST_FILES_DIR, "test.pdf")
-        markitdown = MarkItDown()
 
         result = markitdown.convert(pdf_path)
 
@@ -517,15 +634,18 @@ class TestMetadataExtractionFromRealFiles:
         assert metadata is not None
         assert metadata.word_count is not None
         assert metadata.character_count is not None
+        # Dates come from the document info dictionary
+        assert metadata.date_created == datetime(2023, 10, 5, 0, 7, 56)
+        # Empty info entries are not reported
+        assert metadata.title is None
 
     @pytest.mark.skipif(
         not os.path.exists(os.path.join(TEST_FILES_DIR, "test.xlsx")),
         reason="Test file not found"
     )
-    def test_extract_xlsx_metadata(self):
+    def test_extract_xlsx_metadata(self, markitdown):
         """Test extracting metadata from an XLSX file."""
         xlsx_path = os.path.join(TEST_FILES_DIR, "test.xlsx")
-        markitdown = MarkItDown()
 
         result = markitdown.convert(xlsx_path)
 
@@ -537,10 +657,9 @@ class TestMetadataExtractionFromRealFiles:
         not os.path.exists(os.path.join(TEST_FILES_DIR, "test.pptx")),
         reason="Test file not found"
     )
-    def test_extract_pptx_metadata(self):
+    def test_extract_pptx_metadata(self, markitdown):
         """Test extracting metadata from a PPTX file."""
         pptx_path = os.path.join(TEST_FILES_DIR, "test.pptx")
-        markitdown = MarkItDown()
 
         result = markitdown.convert(pptx_path)
 
@@ -552,10 +671,9 @@ class TestMetadataExtractionFromRealFiles:
         not os.path.exists(os.path.join(TEST_FILES_DIR, "test_blog.html")),
         reason="Test file not found"
     )
-    def test_extract_html_metadata(self):
+    def test_extract_html_metadata(self, markitdown):
         """Test extracting metadata from an HTML file."""
         html_path = os.path.join(TEST_FILES_DIR, "test_blog.html")
-        markitdown = MarkItDown()
 
         result = markitdown.convert(html_path)
 
@@ -567,10 +685,9 @@ class TestMetadataExtractionFromRealFiles:
         not os.path.exists(os.path.join(TEST_FILES_DIR, "test.epub")),
         reason="Test file not found"
     )
-    def test_extract_epub_metadata(self):
+    def test_extract_epub_metadata(self, markitdown):
         """Test extracting metadata from an EPUB file."""
         epub_path = os.path.join(TEST_FILES_DIR, "test.epub")
-        markitdown = MarkItDown()
 
         result = markitdown.convert(epub_path)
 
@@ -582,68 +699,74 @@ class TestMetadataExtractionFromRealFiles:
 class TestMetadataErrorHandling:
     """Tests for error handling in metadata extraction."""
 
-    def test_metadata_extraction_does_not_interrupt_conversion(self):
+    def test_metadata_extraction_does_not_interrupt_conversion(self, markitdown):
         """Test that metadata extraction errors don't interrupt conversion."""
-        # Create a file that will convert but fail metadata extraction
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Simple text content")
-            temp_path = f.name
-
-        try:
-            markitdown = MarkItDown()
-
-            # Mock extract_metadata to raise an exception
-            with patch('markitdown._markitdown.extract_metadata') as mock_extract:
-                mock_extract.side_effect = RuntimeError("Metadata extraction failed!")
-
-                # Conversion should still succeed
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    result = markitdown.convert(temp_path)
-
-                    # Should have warning about metadata failure
-                    assert len(w) >= 1
-                    assert any("Metadata extraction failed" in str(warning.message) for warning in w)
-
-                # Result should still be valid
-                assert result is not None
-                assert "Simple text content" in result.markdown
-        finally:
-            os.unlink(temp_path)
-
-    def test_metadata_extraction_warning_includes_details(self):
+        # A stream that will convert but fail metadata extraction
+        stream = io.BytesIO(b"Simple text content")
+
+        # Mock extract_metadata to raise an exception
+        with patch('markitdown._markitdown.extract_metadata') as mock_extract:
+            mock_extract.side_effect = RuntimeError("Metadata extraction failed!")
+
+            # Conversion should still succeed
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                result = markitdown.convert_stream(
+                    stream, stream_info=StreamInfo(extension=".txt")
+                )
+
+                # Should have warning about metadata failure
+                assert len(w) >= 1
+                assert any("Metadata extraction failed" in str(warning.message) for warning in w)
+
+            # Result should still be valid
+            assert result is not None
+            assert "Simple text content" in result.markdown
+
+    def test_metadata_extraction_warning_includes_details(self, markitdown):
         """Test that metadata extraction warning includes error details."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Test content")
-            temp_path = f.name
-
-        try:
-            markitdown = MarkItDown()
-
-            with patch('markitdown._markitdown.extract_metadata') as mock_extract:
-                mock_extract.side_effect = ValueError("Specific error message")
-
-                with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    markitdown.convert(temp_path)
-
-                    # Find the metadata warning
-                    metadata_warnings = [
-                        warning for warning in w
-                        if "Metadata extraction failed" in str(warning.message)
-                    ]
-                    assert len(metadata_warnings) >= 1
-
-                    # Should include exception type and message
-                    warning_msg = str(metadata_warnings[0].message)
-                    assert "ValueError" in warning_msg
-                    assert "Specific error message" in warning_msg
-                    # Should include file type info
-                    assert "type:" in warning_msg
-                    # Should include traceback
-                    assert "Traceback" in warning_msg
-        finally:
-            os.unlink(temp_path)
+        stream = io.BytesIO(b"Test content")
+
+        with patch('markitdown._markitdown.extract_metadata') as mock_extract:
+            mock_extract.side_effect = ValueError("Specific error message")
+
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                markitdown.convert_stream(stream, stream_info=StreamInfo(extension=".txt"))
+
+                # Find the metadata warning
+                metadata_warnings = [
+                    warning for warning in w
+                    if "Metadata extraction failed" in str(warning.message)
+                ]
+                assert len(metadata_warnings) >= 1
+
+                # Should include exception type and message
+                warning_msg = str(metadata_warnings[0].message)
+                assert "ValueError" in warning_msg
+                assert "Specific error message" in warning_msg
+                # Should include file type info
+                assert "type:" in warning_msg
+                # Should include traceback
+                assert "Traceback" in warning_msg
+
+    def test_metadata_extraction_warning_skipped_when_ignored(self, markitdown):
+        """Test that no traceback is formatted when RuntimeWarnings are ignored."""
+        stream = io.BytesIO(b"Test content")
+
+        with patch('markitdown._markitdown.extract_metadata') as mock_extract, \
+                patch('markitdown._markitdown.traceback.format_exc') as mock_format:
+            mock_extract.side_effect = ValueError("Ignored error")
+
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("ignore")
+                result = markitdown.convert_stream(
+                    stream, stream_info=StreamInfo(extension=".txt")
+                )
+
+            assert "Test content" in result.markdown
+            assert len(w) == 0
+            mock_format.assert_not_called()
 
     def test_corrupt_stream_does_not_crash(self):
         """Test that corrupt stream content doesn't crash metadata extraction."""
@@ -807,65 +930,110 @@ class TestMetadataInCache:
             assert restored_result.metadata.character_count == 500
             assert restored_result.metadata.keywords == ["cache", "test"]
 
+    def test_cached_metadata_is_decoded_on_access(self):
+        """Test metadata read from the cache is only decoded when accessed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ConversionCache(Path(tmpdir) / "cache")
+
+            test_file = Path(tmpdir) / "test.txt"
+            test_file.write_text("Lazy metadata content")
+
+            result = DocumentConverterResult(
+                markdown="# Lazy",
+                metadata=DocumentMetadata(title="Lazy", word_count=2),
+            )
+            cache.put(str(test_file), result)
+
+            entry = cache.get(str(test_file))
+            assert entry.metadata_dict is None
+            assert entry.to_dict()["metadata_dict"] == {"title": "Lazy", "word_count": 2}
+
+            restored_result = cache_entry_to_result(entry)
+            assert restored_result._metadata is None
+
+            assert restored_result.metadata.title == "Lazy"
+            assert restored_result._metadata is not None
+            assert restored_result._metadata_raw is None
+
+    @pytest.mark.parametrize(
+        "blob",
+        [
+            pytest.param(b"{not json", id="invalid_json"),
+            pytest.param(b"[1, 2]", id="not_an_object"),
+        ],
+    )
+    def test_corrupt_cached_metadata_is_treated_as_missing(self, tmp_path, blob):
+        """Test a damaged metadata blob yields empty metadata instead of raising."""
+        cache = ConversionCache(tmp_path / "cache")
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("Corrupt metadata content")
+
+        result = DocumentConverterResult(
+            markdown="# Corrupt",
+            metadata=DocumentMetadata(title="Corrupt"),
+        )
+        cache.put(str(test_file), result)
+
+        connection = cache._get_connection()
+        connection.execute("UPDATE entries SET metadata = ?", (blob,))
+        connection.commit()
+
+        entry = cache.get(str(test_file))
+        assert entry is not None
+        assert entry.to_dict()["metadata_dict"] is None
+
+        restored_result = cache_entry_to_result(entry)
+        assert restored_result.markdown == "# Corrupt"
+        assert restored_result._peek_metadata() is None
+        assert restored_result.metadata.is_empty()
+
 
 class TestMetadataInBatchConversion:
     """Tests for metadata in batch conversion."""
 
-    def test_batch_item_has_metadata(self):
+    def test_batch_item_has_metadata(self, markitdown, txt_file):
         """Test that batch items have metadata property."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test file
-            test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("Test content for batch")
-
-            markitdown = MarkItDown()
-            result = markitdown.convert_batch([str(test_file)])
+        result = markitdown.convert_batch([str(txt_file)])
 
-            assert result.success_count == 1
-            item = result.successful_items[0]
+        assert result.success_count == 1
+        item = result.successful_items[0]
 
-            # Should have metadata
-            assert item.metadata is not None
-            assert item.metadata.word_count is not None
+        # Should have metadata
+        assert item.metadata is not None
+        assert item.metadata.word_count is not None
 
-    def test_batch_item_to_dict_includes_metadata(self):
+    def test_batch_item_to_dict_includes_metadata(self, markitdown, txt_file):
         """Test that batch item to_dict includes metadata."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("Content")
+        result = markitdown.convert_batch([str(txt_file)])
 
-            markitdown = MarkItDown()
-            result = markitdown.convert_batch([str(test_file)])
+        item = result.successful_items[0]
+        item_dict = item.to_dict()
 
-            item = result.successful_items[0]
-            item_dict = item.to_dict()
+        # Should have metadata in dict
+        assert "metadata" in item_dict
+        assert item_dict["metadata"] is not None
+        assert "word_count" in item_dict["metadata"]
 
-            # Should have metadata in dict
-            assert "metadata" in item_dict
-            assert item_dict["metadata"] is not None
-            assert "word_count" in item_dict["metadata"]
-
-    def test_cached_batch_item_preserves_metadata(self):
+    def test_cached_batch_item_preserves_metadata(
+        self, markitdown, tmp_root, shared_cache, request
+    ):
         """Test that cached batch items preserve metadata."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = ConversionCache(Path(tmpdir) / "cache")
+        cache = shared_cache
 
-            test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("Cached batch content here")
-
-            markitdown = MarkItDown()
+        test_file = tmp_root / f"{request.node.name}.txt"
+        _write(test_file, b"Cached batch content here")
 
-            # First run - stores in cache
-            result1 = markitdown.convert_batch([str(test_file)], cache=cache)
-            original_metadata = result1.successful_items[0].metadata
+        # First run - stores in cache
+        result1 = markitdown.convert_batch([str(test_file)], cache=cache)
+        original_metadata = result1.successful_items[0].metadata
 
-            # Second run - from cache
-            result2 = markitdown.convert_batch([str(test_file)], cache=cache)
-            cached_metadata = result2.successful_items[0].metadata
+        # Second run - from cache
+        result2 = markitdown.convert_batch([str(test_file)], cache=cache)
+        cached_metadata = result2.successful_items[0].metadata
 
-            assert result2.cached_count == 1
-            assert cached_metadata is not None
-            assert cached_metadata.word_count == original_metadata.word_count
+        assert result2.cached_count == 1
+        assert cached_metadata is not None
+        assert cached_metadata.word_count == original_metadata.word_count
 
 
 class TestMetadataInDocumentConverterResult:
@@ -878,7 +1046,9 @@ class TestMetadataInDocumentConverterResult:
         # Accessing metadata should work
         metadata = result.metadata
         assert metadata is not None
-        assert isinstance(metadata, DocumentMetadata)
+        # The default is always a plain DocumentMetadata. Relax this to
+        # isinstance() if results ever carry metadata subclasses.
+        assert type(metadata) is DocumentMetadata
 
     def test_result_lazy_initializes_metadata(self):
         """Test metadata is lazily initialized."""
@@ -891,80 +1061,60 @@ class TestMetadataInDocumentConverterResult:
         _ = result.metadata
         assert result._metadata is not None
 
-    def test_result_accepts_metadata_in_constructor(self):
+    def test_result_uses_slots(self):
+        """Test DocumentConverterResult has no per-instance __dict__."""
+        result = DocumentConverterResult(markdown="# Test")
+
+        assert not hasattr(result, "__dict__")
+
+    def test_result_accepts_metadata_in_constructor(self, sample_metadata):
         """Test result can accept metadata in constructor."""
-        metadata = DocumentMetadata(title="Provided", word_count=100)
         result = DocumentConverterResult(
             markdown="# Test",
-            metadata=metadata,
+            metadata=sample_metadata,
         )
 
-        assert result.metadata.title == "Provided"
+        assert result.metadata.title == "Sample"
         assert result.metadata.word_count == 100
 
-    def test_result_metadata_setter(self):
+    def test_result_metadata_setter(self, sample_metadata):
         """Test metadata can be set via property."""
         result = DocumentConverterResult(markdown="# Test")
-        metadata = DocumentMetadata(title="Set via setter")
 
-        result.metadata = metadata
+        result.metadata = sample_metadata
 
-        assert result.metadata.title == "Set via setter"
+        assert result.metadata is sample_metadata
+        assert result.metadata.title == "Sample"
 
 
 class TestMetadataEdgeCases:
     """Edge case tests for metadata."""
 
-    def test_metadata_with_unicode(self):
-        """Test metadata handles unicode correctly."""
-        metadata = DocumentMetadata(
-            title="文档标题",
-            author="作者名",
-            description="日本語の説明",
-            keywords=["한국어", "العربية", "emoji 🎉"],
-        )
-
-        # Roundtrip
-        d = metadata.to_dict()
-        restored = DocumentMetadata.from_dict(d)
-
-        assert restored.title == "文档标题"
-        assert restored.author == "作者名"
-        assert restored.description == "日本語の説明"
-        assert "emoji 🎉" in restored.keywords
-
-    def test_metadata_with_special_characters(self):
-        """Test metadata handles special characters."""
-        metadata = DocumentMetadata(
-            title="Title with \"quotes\" and 'apostrophes'",
-            description="Line1\nLine2\tTabbed",
-            keywords=["back\\slash", "forward/slash"],
-        )
+    @pytest.mark.usefixtures("no_gc")
+    @pytest.mark.parametrize("fields", _ROUNDTRIP_EDGE_CASES)
+    def test_metadata_roundtrip_edge_cases(self, fields):
+        """Test unusual field values survive a to_dict/from_dict roundtrip."""
+        metadata = DocumentMetadata(**fields)
 
-        d = metadata.to_dict()
-        restored = DocumentMetadata.from_dict(d)
+        restored = DocumentMetadata.from_dict(metadata.to_dict())
 
-        assert restored.title == "Title with \"quotes\" and 'apostrophes'"
-        assert "Line1\nLine2" in restored.description
+        assert restored == metadata
 
-    def test_metadata_with_large_values(self):
-        """Test metadata handles large values."""
-        large_description = "x" * 10000
-        many_keywords = [f"keyword{i}" for i in range(1000)]
+    @pytest.mark.usefixtures("no_gc")
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("fields", _ROUNDTRIP_EDGE_CASES)
+    def test_metadata_cache_json_roundtrip_edge_cases(self, fields, use_orjson):
+        """Test edge-case values survive the cache's JSON encoding, with and without orjson."""
+        if use_orjson and _cache_module.orjson is None:
+            pytest.skip("orjson is not installed")
 
-        metadata = DocumentMetadata(
-            description=large_description,
-            keywords=many_keywords,
-            word_count=10000000,
-            character_count=50000000,
-        )
+        metadata = DocumentMetadata(**fields)
 
-        d = metadata.to_dict()
-        restored = DocumentMetadata.from_dict(d)
+        with patch.object(_cache_module, "orjson", _cache_module.orjson if use_orjson else None):
+            data = _cache_module._json_loads(_cache_module._json_dumps(metadata.to_dict()))
+        restored = DocumentMetadata.from_dict(data)
 
-        assert len(restored.description) == 10000
-        assert len(restored.keywords) == 1000
-        assert restored.word_count == 10000000
+        assert restored == metadata
 
     def test_metadata_with_zero_counts(self):
         """Test metadata handles zero counts."""
@@ -980,24 +1130,6 @@ class TestMetadataEdgeCases:
         assert d["character_count"] == 0
         assert d["page_count"] == 0
 
-    def test_metadata_dates_at_boundaries(self):
-        """Test metadata handles date boundary values."""
-        # Very old date
-        old_date = datetime(1900, 1, 1, 0, 0, 0)
-        # Future date
-        future_date = datetime(2100, 12, 31, 23, 59, 59)
-
-        metadata = DocumentMetadata(
-            date_created=old_date,
-            date_modified=future_date,
-        )
-
-        d = metadata.to_dict()
-        restored = DocumentMetadata.from_dict(d)
-
-        assert restored.date_created == old_date
-        assert restored.date_modified == future_date
-
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3 -m pytest
 """Tests for the token estimation feature in batch conversions."""
 
+import contextlib
+import dataclasses
+import io
 import os
 import subprocess
 import sys
@@ -21,8 +24,9 @@ from markitdown import (
 from markitdown._token_estimator import (
     _estimate_image_tokens,
     _estimate_pptx_image_count,
+    _pptx_image_count_formula,
+    _PPTX_IMAGE_COUNT_THRESHOLDS,
     IMAGE_EXTENSIONS,
-    PPTX_EXTENSIONS,
     DEFAULT_PROMPT_TOKENS,
     DEFAULT_OUTPUT_TOKENS,
     BASE_IMAGE_TOKENS,
@@ -33,6 +37,66 @@ TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
 MARKITDOWN_MODULE = "markitdown"
 
 
+def _sparse(path: Path, size: int) -> str:
+    """
+    Create a file of the given size at path without writing any data.
+
+    Token estimates only look at file size, so a sparse file stands in for
+    real content.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+    return str(path)
+
+
+# (extension, size) pairs created once by the fixture_files fixture
+_FIXTURE_FILE_SIZES = [
+    (".jpg", 100000),
+    (".jpeg", 100000),
+    (".png", 100000),
+    (".pdf", 100000),
+    (".docx", 100000),
+    (".xlsx", 100000),
+    (".html", 100000),
+    (".txt", 100000),
+    (".csv", 100000),
+    (".pptx", 100000),
+    (".pptx", 2000000),
+]
+
+
+@pytest.fixture(scope="session")
+def fixture_files(tmp_path_factory):
+    """Sparse input files shared by the single-file tests, keyed by (ext, size)."""
+    root = tmp_path_factory.mktemp("fixture_files")
+    return {
+        (ext, size): _sparse(root / f"file{size}{ext}", size)
+        for ext, size in _FIXTURE_FILE_SIZES
+    }
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """
+    One directory for the batch tests' input files.
+
+    The batch estimator only stats its inputs, so tests can share a
+    directory as long as each uses its own file names.
+    """
+    return tmp_path_factory.mktemp("token_est")
+
+
+@pytest.fixture(scope="session")
+def pptx_path(tmp_path_factory):
+    """A single .pptx file that size-based tests truncate to the size they need."""
+    path = tmp_path_factory.mktemp("token_estimator") / "sized.pptx"
+    path.touch()
+    return str(path)
+
+
 class TestFileCategory:
     """Tests for FileCategory enum."""
 
@@ -122,6 +186,23 @@ class TestFileTokenEstimate:
 
         assert d["skip_reason"] == "File type does not use LLM"
 
+    def test_file_token_estimate_uses_slots(self):
+        """Test FileTokenEstimate has no per-instance __dict__."""
+        estimate = FileTokenEstimate(
+            source_path="/test/image.png", category=FileCategory.IMAGE
+        )
+
+        assert not hasattr(estimate, "__dict__")
+
+    def test_file_token_estimate_is_frozen(self):
+        """Test FileTokenEstimate fields cannot be reassigned."""
+        estimate = FileTokenEstimate(
+            source_path="/test/image.png", category=FileCategory.IMAGE
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            estimate.input_tokens = 100
+
 
 class TestBatchTokenEstimate:
     """Tests for BatchTokenEstimate dataclass."""
@@ -238,6 +319,25 @@ class TestBatchTokenEstimate:
         assert len(resumed) == 1
         assert resumed[0].source_path == "/test/resumed.jpg"
 
+    def test_batch_token_estimate_filters_track_files(self):
+        """Test filter properties reflect in-place changes and return fresh lists."""
+        batch = BatchTokenEstimate(files=[
+            FileTokenEstimate(source_path="/test/doc.pdf", category=FileCategory.NO_LLM),
+        ])
+        assert len(batch.files_using_llm) == 0
+
+        batch.files_skipped.append(batch.files[0])
+        assert len(batch.files_skipped) == 1
+
+        batch.files[0] = FileTokenEstimate(
+            source_path="/test/image.jpg",
+            category=FileCategory.IMAGE,
+            input_tokens=500,
+            output_tokens=150,
+        )
+        assert len(batch.files_using_llm) == 1
+        assert len(batch.files_skipped) == 0
+
     def test_batch_token_estimate_to_dict(self):
         """Test BatchTokenEstimate serialization."""
         batch = BatchTokenEstimate()
@@ -280,48 +380,33 @@ class TestBatchTokenEstimate:
 class TestEstimateImageTokens:
     """Tests for _estimate_image_tokens function."""
 
-    def test_estimate_small_image(self):
+    def test_estimate_small_image(self, tmp_path):
         """Test token estimation for small image."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            # Write ~10KB of data (small image)
-            f.write(b"x" * 10000)
-            temp_path = f.name
+        # ~10KB file (small image)
+        temp_path = _sparse(tmp_path / "file.jpg", 10000)
 
-        try:
-            tokens = _estimate_image_tokens(temp_path)
-            # Should have base tokens plus some tiles
-            assert tokens >= BASE_IMAGE_TOKENS
-            assert tokens < BASE_IMAGE_TOKENS + TOKENS_PER_TILE * 20
-        finally:
-            os.unlink(temp_path)
+        tokens = _estimate_image_tokens(temp_path)
+        # Should have base tokens plus some tiles
+        assert tokens >= BASE_IMAGE_TOKENS
+        assert tokens < BASE_IMAGE_TOKENS + TOKENS_PER_TILE * 20
 
-    def test_estimate_medium_image(self):
+    def test_estimate_medium_image(self, tmp_path):
         """Test token estimation for medium image."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            # Write ~500KB of data (medium image)
-            f.write(b"x" * 500000)
-            temp_path = f.name
+        # ~500KB file (medium image)
+        temp_path = _sparse(tmp_path / "file.jpg", 500000)
 
-        try:
-            tokens = _estimate_image_tokens(temp_path)
-            # Should have more tokens than small image
-            assert tokens >= BASE_IMAGE_TOKENS + TOKENS_PER_TILE
-        finally:
-            os.unlink(temp_path)
+        tokens = _estimate_image_tokens(temp_path)
+        # Should have more tokens than small image
+        assert tokens >= BASE_IMAGE_TOKENS + TOKENS_PER_TILE
 
-    def test_estimate_large_image(self):
+    def test_estimate_large_image(self, tmp_path):
         """Test token estimation for large image."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            # Write ~5MB of data (large image)
-            f.write(b"x" * 5000000)
-            temp_path = f.name
+        # ~5MB file (large image)
+        temp_path = _sparse(tmp_path / "file.jpg", 5000000)
 
-        try:
-            tokens = _estimate_image_tokens(temp_path)
-            # Should have significant tokens for large image
-            assert tokens >= BASE_IMAGE_TOKENS + TOKENS_PER_TILE * 4
-        finally:
-            os.unlink(temp_path)
+        tokens = _estimate_image_tokens(temp_path)
+        # Should have significant tokens for large image
+        assert tokens >= BASE_IMAGE_TOKENS + TOKENS_PER_TILE * 4
 
     def test_estimate_nonexistent_file(self):
         """Test token estimation for nonexistent file returns default."""
@@ -333,223 +418,119 @@ class TestEstimateImageTokens:
 class TestEstimatePptxImageCount:
     """Tests for _estimate_pptx_image_count function."""
 
-    def test_estimate_tiny_pptx(self):
-        """Test estimation for tiny PPTX (<0.5MB) - likely no images."""
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as f:
-            # Write ~100KB
-            f.write(b"x" * 100000)
-            temp_path = f.name
-
-        try:
-            count = _estimate_pptx_image_count(temp_path)
-            assert count == 0
-        finally:
-            os.unlink(temp_path)
-
-    def test_estimate_small_pptx(self):
-        """Test estimation for small PPTX (0.5-1MB)."""
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as f:
-            # Write ~750KB
-            f.write(b"x" * 750000)
-            temp_path = f.name
-
-        try:
-            count = _estimate_pptx_image_count(temp_path)
-            assert count == 1
-        finally:
-            os.unlink(temp_path)
-
-    def test_estimate_medium_pptx(self):
-        """Test estimation for medium PPTX (1-2MB)."""
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as f:
-            # Write ~1.5MB
-            f.write(b"x" * 1500000)
-            temp_path = f.name
-
-        try:
-            count = _estimate_pptx_image_count(temp_path)
-            # Should be 1-3 images
-            assert 1 <= count <= 4
-        finally:
-            os.unlink(temp_path)
-
-    def test_estimate_large_pptx(self):
-        """Test estimation for large PPTX (10-50MB)."""
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as f:
-            # Write ~20MB
-            f.write(b"x" * 20000000)
-            temp_path = f.name
-
-        try:
-            count = _estimate_pptx_image_count(temp_path)
-            # Should use logarithmic scaling, not linear
+    @pytest.mark.parametrize(
+        "size, min_count, max_count",
+        [
+            # Tiny (<0.5MB) - likely no images
+            pytest.param(100_000, 0, 0, id="tiny"),
+            # Small (0.5-1MB)
+            pytest.param(750_000, 1, 1, id="small"),
+            # Medium (1-2MB): 1-3 images
+            pytest.param(1_500_000, 1, 4, id="medium"),
+            # Large (10-50MB) uses logarithmic scaling, not linear.
             # Old formula would give 40+ images, new formula gives ~15-18
-            assert count < 30
-            assert count >= 8
-        finally:
-            os.unlink(temp_path)
-
-    def test_estimate_very_large_pptx(self):
-        """Test estimation for very large PPTX (>50MB) is capped."""
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as f:
-            # Write ~60MB
-            f.write(b"x" * 60000000)
-            temp_path = f.name
-
-        try:
-            count = _estimate_pptx_image_count(temp_path)
-            # Should be capped at ~25 images max
+            pytest.param(20_000_000, 8, 29, id="large"),
+            # Very large (>50MB) is capped at ~25 images.
             # Old formula would give 90 images, new formula caps at ~20-25
-            assert count <= 25
-            assert count >= 15
-        finally:
-            os.unlink(temp_path)
+            pytest.param(60_000_000, 15, 25, id="very_large"),
+            # Huge files often contain video/audio, not more images
+            pytest.param(100_000_000, 0, 25, id="huge"),
+        ],
+    )
+    def test_estimate_pptx_by_size(self, pptx_path, size, min_count, max_count):
+        """Test PPTX image count estimates for each size bucket."""
+        os.truncate(pptx_path, size)
 
-    def test_estimate_huge_pptx_is_reasonable(self):
-        """Test that huge PPTX files don't overestimate."""
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as f:
-            # Write ~100MB (might have embedded videos)
-            f.write(b"x" * 100000000)
-            temp_path = f.name
+        count = _estimate_pptx_image_count(pptx_path)
 
-        try:
-            count = _estimate_pptx_image_count(temp_path)
-            # Should not estimate more than 25 images for very large files
-            # because large files often contain video/audio, not more images
-            assert count <= 25
-        finally:
-            os.unlink(temp_path)
+        assert min_count <= count <= max_count
 
     def test_estimate_nonexistent_pptx(self):
         """Test estimation for nonexistent file returns 0."""
         count = _estimate_pptx_image_count("/nonexistent/file.pptx")
         assert count == 0
 
+    def test_lookup_matches_formula(self):
+        """Test the threshold lookup agrees with the formula at every step."""
+        sizes = {0, 1 << 40}
+        for threshold in _PPTX_IMAGE_COUNT_THRESHOLDS:
+            sizes.update((threshold - 1, threshold, threshold + 1))
+
+        for size in sorted(sizes):
+            assert _estimate_pptx_image_count("unused.pptx", size=size) == (
+                _pptx_image_count_formula(size)
+            )
+
 
 class TestEstimateFileTokens:
     """Tests for estimate_file_tokens function."""
 
-    def test_estimate_jpg_file(self):
+    def test_estimate_jpg_file(self, fixture_files):
         """Test estimation for JPG file."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            f.write(b"x" * 100000)  # 100KB
-            temp_path = f.name
+        estimate = estimate_file_tokens(fixture_files[(".jpg", 100000)])
 
-        try:
-            estimate = estimate_file_tokens(temp_path)
-
-            assert estimate.category == FileCategory.IMAGE
-            assert estimate.input_tokens > 0
-            assert estimate.output_tokens == DEFAULT_OUTPUT_TOKENS
-            assert estimate.image_count == 1
-            assert estimate.file_size_bytes == 100000
-        finally:
-            os.unlink(temp_path)
+        assert estimate.category == FileCategory.IMAGE
+        assert estimate.input_tokens > 0
+        assert estimate.output_tokens == DEFAULT_OUTPUT_TOKENS
+        assert estimate.image_count == 1
+        assert estimate.file_size_bytes == 100000
 
-    def test_estimate_png_file(self):
+    def test_estimate_png_file(self, fixture_files):
         """Test estimation for PNG file."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(b"x" * 100000)  # 100KB
-            temp_path = f.name
-
-        try:
-            estimate = estimate_file_tokens(temp_path)
+        estimate = estimate_file_tokens(fixture_files[(".png", 100000)])
 
-            assert estimate.category == FileCategory.IMAGE
-            assert estimate.image_count == 1
-        finally:
-            os.unlink(temp_path)
+        assert estimate.category == FileCategory.IMAGE
+        assert estimate.image_count == 1
 
-    def test_estimate_jpeg_file(self):
+    def test_estimate_jpeg_file(self, fixture_files):
         """Test estimation for JPEG file (alternative extension)."""
-        with tempfile.NamedTemporaryFile(suffix=".jpeg", delete=False) as f:
-            f.write(b"x" * 100000)  # 100KB
-            temp_path = f.name
+        estimate = estimate_file_tokens(fixture_files[(".jpeg", 100000)])
 
-        try:
-            estimate = estimate_file_tokens(temp_path)
-
-            assert estimate.category == FileCategory.IMAGE
-        finally:
-            os.unlink(temp_path)
+        assert estimate.category == FileCategory.IMAGE
 
-    def test_estimate_pptx_file(self):
+    def test_estimate_pptx_file(self, fixture_files):
         """Test estimation for PPTX file."""
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as f:
-            f.write(b"x" * 2000000)  # 2MB
-            temp_path = f.name
-
-        try:
-            estimate = estimate_file_tokens(temp_path)
+        estimate = estimate_file_tokens(fixture_files[(".pptx", 2000000)])
 
-            assert estimate.category == FileCategory.PPTX
-            assert estimate.input_tokens > 0
-            assert estimate.output_tokens > 0
-            assert estimate.image_count > 0
-        finally:
-            os.unlink(temp_path)
+        assert estimate.category == FileCategory.PPTX
+        assert estimate.input_tokens > 0
+        assert estimate.output_tokens > 0
+        assert estimate.image_count > 0
 
-    def test_estimate_small_pptx_no_images(self):
+    def test_estimate_small_pptx_no_images(self, fixture_files):
         """Test estimation for small PPTX with no estimated images."""
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as f:
-            f.write(b"x" * 100000)  # 100KB - very small
-            temp_path = f.name
+        estimate = estimate_file_tokens(fixture_files[(".pptx", 100000)])
 
-        try:
-            estimate = estimate_file_tokens(temp_path)
-
-            assert estimate.category == FileCategory.NO_LLM
-            assert estimate.input_tokens == 0
-            assert estimate.output_tokens == 0
-            assert estimate.image_count == 0
-            assert "no estimated images" in estimate.skip_reason.lower()
-        finally:
-            os.unlink(temp_path)
+        assert estimate.category == FileCategory.NO_LLM
+        assert estimate.input_tokens == 0
+        assert estimate.output_tokens == 0
+        assert estimate.image_count == 0
+        assert "no estimated images" in estimate.skip_reason.lower()
 
-    def test_estimate_pdf_file(self):
+    def test_estimate_pdf_file(self, fixture_files):
         """Test estimation for PDF file (no LLM)."""
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
-            f.write(b"x" * 100000)
-            temp_path = f.name
+        estimate = estimate_file_tokens(fixture_files[(".pdf", 100000)])
 
-        try:
-            estimate = estimate_file_tokens(temp_path)
-
-            assert estimate.category == FileCategory.NO_LLM
-            assert estimate.input_tokens == 0
-            assert estimate.output_tokens == 0
-            assert estimate.skip_reason == "File type does not use LLM"
-        finally:
-            os.unlink(temp_path)
+        assert estimate.category == FileCategory.NO_LLM
+        assert estimate.input_tokens == 0
+        assert estimate.output_tokens == 0
+        assert estimate.skip_reason == "File type does not use LLM"
 
-    def test_estimate_docx_file(self):
+    def test_estimate_docx_file(self, fixture_files):
         """Test estimation for DOCX file (no LLM)."""
-        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as f:
-            f.write(b"x" * 100000)
-            temp_path = f.name
+        estimate = estimate_file_tokens(fixture_files[(".docx", 100000)])
 
-        try:
-            estimate = estimate_file_tokens(temp_path)
-
-            assert estimate.category == FileCategory.NO_LLM
-        finally:
-            os.unlink(temp_path)
+        assert estimate.category == FileCategory.NO_LLM
 
-    def test_estimate_resumed_file(self):
+    def test_estimate_resumed_file(self, fixture_files):
         """Test estimation for resumed file."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            f.write(b"x" * 100000)
-            temp_path = f.name
+        estimate = estimate_file_tokens(fixture_files[(".jpg", 100000)], is_resumed=True)
 
-        try:
-            estimate = estimate_file_tokens(temp_path, is_resumed=True)
-
-            assert estimate.category == FileCategory.RESUMED
-            assert estimate.input_tokens == 0
-            assert estimate.output_tokens == 0
-            assert estimate.skip_reason == "Output file already exists"
-        finally:
-            os.unlink(temp_path)
+        assert estimate.category == FileCategory.RESUMED
+        assert estimate.input_tokens == 0
+        assert estimate.output_tokens == 0
+        assert estimate.skip_reason == "Output file already exists"
+        assert estimate.file_size_bytes == 100000
 
     def test_estimate_cached_file(self):
         """Test estimation for cached file."""
@@ -557,8 +538,7 @@ class TestEstimateFileTokens:
             cache = ConversionCache(Path(tmpdir) / "cache")
 
             # Create and cache a test file
-            test_file = Path(tmpdir) / "test.jpg"
-            test_file.write_bytes(b"x" * 100000)
+            test_file = _sparse(Path(tmpdir) / "test.jpg", 100000)
 
             # Manually add to cache
             from markitdown import DocumentConverterResult
@@ -572,6 +552,18 @@ class TestEstimateFileTokens:
             assert estimate.input_tokens == 0
             assert estimate.output_tokens == 0
             assert estimate.skip_reason == "File is cached"
+            assert estimate.file_size_bytes == 100000
+
+    @pytest.mark.parametrize("key", [(".jpg", 100000), (".pptx", 2000000)])
+    def test_estimate_stats_file_once(self, fixture_files, key):
+        """Test the file is stat'ed once and the size is shared with the helpers."""
+        path = fixture_files[key]
+
+        with patch("markitdown._token_estimator.os.stat", wraps=os.stat) as mock_stat:
+            estimate = estimate_file_tokens(path)
+
+        mock_stat.assert_called_once()
+        assert estimate.file_size_bytes == key[1]
 
 
 class TestEstimateBatchTokens:
@@ -584,27 +576,48 @@ class TestEstimateBatchTokens:
         assert len(batch.files) == 0
         assert batch.total_tokens == 0
 
-    def test_estimate_batch_mixed_files(self):
+    def test_estimate_batch_mixed_files(self, shared_tmp):
         """Test estimation for batch with mixed file types."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test files
-            jpg_file = Path(tmpdir) / "image.jpg"
-            jpg_file.write_bytes(b"x" * 100000)
+        # Create test files
+        jpg_file = _sparse(shared_tmp / "mixed_image.jpg", 100000)
 
-            pdf_file = Path(tmpdir) / "doc.pdf"
-            pdf_file.write_bytes(b"x" * 100000)
+        pdf_file = _sparse(shared_tmp / "mixed_doc.pdf", 100000)
 
-            pptx_file = Path(tmpdir) / "slides.pptx"
-            pptx_file.write_bytes(b"x" * 2000000)  # 2MB - has images
+        pptx_file = _sparse(shared_tmp / "mixed_slides.pptx", 2000000)  # 2MB - has images
 
-            files = [str(jpg_file), str(pdf_file), str(pptx_file)]
+        files = [str(jpg_file), str(pdf_file), str(pptx_file)]
 
-            batch = estimate_batch_tokens(files)
+        batch = estimate_batch_tokens(files)
 
-            assert len(batch.files) == 3
-            assert len(batch.files_using_llm) == 2  # jpg and pptx
-            assert len(batch.files_skipped) == 1  # pdf
-            assert batch.total_tokens > 0
+        assert len(batch.files) == 3
+        assert len(batch.files_using_llm) == 2  # jpg and pptx
+        assert len(batch.files_skipped) == 1  # pdf
+        assert batch.total_tokens > 0
+
+    def test_estimate_batch_parallel_matches_sequential(self, shared_tmp):
+        """Test the thread pool produces the same estimates, in order."""
+        files = []
+        for i, ext in enumerate([".jpg", ".pdf", ".pptx", ".png"] * 3):
+            f = _sparse(shared_tmp / f"parallel{i}{ext}", (i + 1) * 200000)
+            files.append(str(f))
+
+        sequential = estimate_batch_tokens(files, max_workers=1)
+        parallel = estimate_batch_tokens(files, max_workers=4)
+
+        assert parallel.to_dict() == sequential.to_dict()
+
+    def test_estimate_batch_duplicate_paths_checked_once(self, shared_tmp):
+        """Test a path listed twice is only looked up in the cache once."""
+        jpg_file = _sparse(shared_tmp / "duplicate.jpg", 100000)
+
+        cache = MagicMock()
+        cache.has.return_value = False
+
+        batch = estimate_batch_tokens([str(jpg_file), str(jpg_file)], cache=cache)
+
+        assert len(batch.files) == 2
+        assert batch.files[0].total_tokens == batch.files[1].total_tokens > 0
+        cache.has.assert_called_once_with(str(jpg_file))
 
     def test_estimate_batch_with_cache(self):
         """Test estimation for batch with cached files."""
@@ -612,16 +625,14 @@ class TestEstimateBatchTokens:
             cache = ConversionCache(Path(tmpdir) / "cache")
 
             # Create and cache a file
-            cached_file = Path(tmpdir) / "cached.jpg"
-            cached_file.write_bytes(b"x" * 100000)
+            cached_file = _sparse(Path(tmpdir) / "cached.jpg", 100000)
 
             from markitdown import DocumentConverterResult
             result = DocumentConverterResult(markdown="# Cached")
             cache.put(str(cached_file), result)
 
             # Create an uncached file
-            new_file = Path(tmpdir) / "new.jpg"
-            new_file.write_bytes(b"x" * 100000)
+            new_file = _sparse(Path(tmpdir) / "new.jpg", 100000)
 
             files = [str(cached_file), str(new_file)]
 
@@ -631,24 +642,21 @@ class TestEstimateBatchTokens:
             assert len(batch.cached_files) == 1
             assert len(batch.files_using_llm) == 1
 
-    def test_estimate_batch_with_resumed_files(self):
+    def test_estimate_batch_with_resumed_files(self, shared_tmp):
         """Test estimation for batch with resumed files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create test files
-            resumed_file = Path(tmpdir) / "resumed.jpg"
-            resumed_file.write_bytes(b"x" * 100000)
+        # Create test files
+        resumed_file = _sparse(shared_tmp / "resumed.jpg", 100000)
 
-            new_file = Path(tmpdir) / "new.jpg"
-            new_file.write_bytes(b"x" * 100000)
+        new_file = _sparse(shared_tmp / "resumed_new.jpg", 100000)
 
-            files = [str(resumed_file), str(new_file)]
-            resumed_files = {str(resumed_file): Path(tmpdir) / "resumed.md"}
+        files = [str(resumed_file), str(new_file)]
+        resumed_files = {str(resumed_file): shared_tmp / "resumed.md"}
 
-            batch = estimate_batch_tokens(files, resumed_files=resumed_files)
+        batch = estimate_batch_tokens(files, resumed_files=resumed_files)
 
-            assert len(batch.files) == 2
-            assert len(batch.resumed_files) == 1
-            assert len(batch.files_using_llm) == 1
+        assert len(batch.files) == 2
+        assert len(batch.resumed_files) == 1
+        assert len(batch.files_using_llm) == 1
 
 
 class TestTokenEstimationIntegration:
@@ -656,11 +664,14 @@ class TestTokenEstimationIntegration:
 
     def test_estimation_with_real_test_files(self):
         """Test estimation with actual test files from test_files directory."""
-        # Find image files in test directory
-        test_files = []
-        for ext in IMAGE_EXTENSIONS:
-            for f in Path(TEST_FILES_DIR).glob(f"*{ext}"):
-                test_files.append(str(f))
+        # Find image files in test directory with a single directory read
+        with os.scandir(TEST_FILES_DIR) as entries:
+            test_files = [
+                entry.path
+                for entry in entries
+                if entry.is_file()
+                and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+            ]
 
         if test_files:
             batch = estimate_batch_tokens(test_files)
@@ -671,20 +682,54 @@ class TestTokenEstimationIntegration:
 class TestTokenEstimationCLI:
     """Tests for token estimation CLI commands."""
 
-    def _run_cli(self, args, check=True):
-        """Helper to run the markitdown CLI command."""
-        cmd = [sys.executable, "-m", MARKITDOWN_MODULE] + args
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(TEST_FILES_DIR),
-        )
+    def _run_cli(self, args, check=True, in_process=True):
+        """
+        Helper to run the markitdown CLI command.
+
+        By default the CLI's main() runs in this interpreter, which avoids
+        starting a new Python process per test. Pass in_process=False to go
+        through `python -m markitdown` and exercise the real entry point.
+        """
+        if in_process:
+            result = self._run_inproc(args)
+        else:
+            cmd = [sys.executable, "-m", MARKITDOWN_MODULE] + args
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=os.path.dirname(TEST_FILES_DIR),
+            )
         if check and result.returncode != 0:
             print(f"STDOUT: {result.stdout}")
             print(f"STDERR: {result.stderr}")
         return result
 
+    def _run_inproc(self, args):
+        """Run the CLI's main() in-process, capturing its exit code and output."""
+        from markitdown.__main__ import main
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        returncode = 0
+        cwd = os.getcwd()
+        os.chdir(os.path.dirname(TEST_FILES_DIR))
+        try:
+            with patch.object(sys, "argv", [MARKITDOWN_MODULE] + args), \
+                    contextlib.redirect_stdout(stdout), \
+                    contextlib.redirect_stderr(stderr):
+                main()
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                returncode = e.code
+            else:
+                returncode = 0 if e.code is None else 1
+        finally:
+            os.chdir(cwd)
+
+        return subprocess.CompletedProcess(
+            args, returncode, stdout.getvalue(), stderr.getvalue()
+        )
+
     def test_cli_estimate_tokens_requires_batch(self):
         """Test --estimate-tokens requires --batch."""
         result = self._run_cli([
@@ -706,6 +751,17 @@ class TestTokenEstimationCLI:
         assert result.returncode == 0
         assert "TOKEN ESTIMATION SUMMARY" in result.stderr
 
+    def test_cli_estimate_tokens_subprocess(self):
+        """Test --estimate-tokens through the real `python -m markitdown` entry point."""
+        result = self._run_cli([
+            "--batch", TEST_FILES_DIR,
+            "--include", "*.jpg",
+            "--estimate-tokens",
+        ], check=False, in_process=False)
+
+        assert result.returncode == 0
+        assert "TOKEN ESTIMATION SUMMARY" in result.stderr
+
     def test_cli_estimate_tokens_with_cache(self):
         """Test --estimate-tokens with --cache."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -745,6 +801,54 @@ class TestTokenEstimationCLI:
             assert "files" in manifest
             assert "total_tokens" in manifest["summary"]
 
+    @pytest.mark.parametrize(
+        "use_orjson",
+        [pytest.param(True, id="orjson"), pytest.param(False, id="stdlib-json")],
+    )
+    def test_write_token_manifest(self, tmp_path, use_orjson):
+        """Test token manifests read back the same with or without orjson."""
+        from markitdown.__main__ import _write_token_manifest
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+
+        batch = BatchTokenEstimate(files=[
+            FileTokenEstimate(
+                source_path="/test/image.jpg",
+                category=FileCategory.IMAGE,
+                input_tokens=500,
+                output_tokens=150,
+                image_count=1,
+            ),
+        ])
+        manifest_path = tmp_path / "tokens.json"
+
+        modules = {} if use_orjson else {"orjson": None}
+        with patch.dict(sys.modules, modules):
+            _write_token_manifest(manifest_path, batch.to_dict())
+
+        with open(manifest_path) as f:
+            assert json.load(f) == batch.to_dict()
+
+    def test_cli_estimate_tokens_parallel(self):
+        """Test --parallel sets the worker count used for estimation."""
+        from markitdown import _token_estimator
+
+        with patch.object(
+            _token_estimator,
+            "estimate_batch_tokens",
+            wraps=_token_estimator.estimate_batch_tokens,
+        ) as mock_estimate:
+            result = self._run_cli([
+                "--batch", TEST_FILES_DIR,
+                "--include", "*.jpg",
+                "--estimate-tokens",
+                "--parallel", "1",
+            ], check=False)
+
+        assert result.returncode == 0
+        assert mock_estimate.call_args.kwargs["max_workers"] == 1
+
     def test_cli_estimate_tokens_no_conversion(self):
         """Test that --estimate-tokens doesn't perform actual conversion."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -767,43 +871,29 @@ class TestTokenEstimationCLI:
 class TestTokenEstimationEdgeCases:
     """Edge case tests for token estimation."""
 
-    def test_estimate_empty_file(self):
+    def test_estimate_empty_file(self, tmp_path):
         """Test estimation for empty file."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            # Empty file
-            temp_path = f.name
+        temp_path = tmp_path / "empty.jpg"
+        temp_path.touch()
 
-        try:
-            estimate = estimate_file_tokens(temp_path)
-            # Should still categorize as image
-            assert estimate.category == FileCategory.IMAGE
-            assert estimate.file_size_bytes == 0
-        finally:
-            os.unlink(temp_path)
+        estimate = estimate_file_tokens(temp_path)
+        # Should still categorize as image
+        assert estimate.category == FileCategory.IMAGE
+        assert estimate.file_size_bytes == 0
 
-    def test_estimate_case_insensitive_extension(self):
+    def test_estimate_case_insensitive_extension(self, tmp_path):
         """Test that extension matching is case insensitive."""
-        with tempfile.NamedTemporaryFile(suffix=".JPG", delete=False) as f:
-            f.write(b"x" * 100000)
-            temp_path = f.name
+        temp_path = _sparse(tmp_path / "image.JPG", 100000)
 
-        try:
-            estimate = estimate_file_tokens(temp_path)
-            assert estimate.category == FileCategory.IMAGE
-        finally:
-            os.unlink(temp_path)
+        estimate = estimate_file_tokens(temp_path)
+        assert estimate.category == FileCategory.IMAGE
 
-    def test_estimate_uppercase_pptx(self):
+    def test_estimate_uppercase_pptx(self, tmp_path):
         """Test estimation for uppercase PPTX extension."""
-        with tempfile.NamedTemporaryFile(suffix=".PPTX", delete=False) as f:
-            f.write(b"x" * 2000000)
-            temp_path = f.name
+        temp_path = _sparse(tmp_path / "slides.PPTX", 2000000)
 
-        try:
-            estimate = estimate_file_tokens(temp_path)
-            assert estimate.category == FileCategory.PPTX
-        finally:
-            os.unlink(temp_path)
+        estimate = estimate_file_tokens(temp_path)
+        assert estimate.category == FileCategory.PPTX
 
     def test_estimate_nonexistent_file(self):
         """Test estimation for nonexistent file."""
@@ -813,82 +903,65 @@ class TestTokenEstimationEdgeCases:
         assert estimate.category == FileCategory.IMAGE
         assert estimate.file_size_bytes == 0
 
-    def test_estimate_special_characters_in_path(self):
+    def test_estimate_special_characters_in_path(self, tmp_path):
         """Test estimation for path with special characters."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            special_path = Path(tmpdir) / "file with spaces & symbols!.jpg"
-            special_path.write_bytes(b"x" * 100000)
+        special_path = _sparse(tmp_path / "file with spaces & symbols!.jpg", 100000)
 
-            estimate = estimate_file_tokens(str(special_path))
-            assert estimate.category == FileCategory.IMAGE
+        estimate = estimate_file_tokens(special_path)
+        assert estimate.category == FileCategory.IMAGE
+        assert estimate.file_size_bytes == 100000
 
-    def test_estimate_unicode_path(self):
+    def test_estimate_unicode_path(self, tmp_path):
         """Test estimation for path with unicode characters."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            unicode_path = Path(tmpdir) / "文件_файл_αρχείο.jpg"
-            unicode_path.write_bytes(b"x" * 100000)
+        unicode_path = _sparse(tmp_path / "文件_файл_αρχείο.jpg", 100000)
 
-            estimate = estimate_file_tokens(str(unicode_path))
-            assert estimate.category == FileCategory.IMAGE
+        estimate = estimate_file_tokens(unicode_path)
+        assert estimate.category == FileCategory.IMAGE
+        assert estimate.file_size_bytes == 100000
 
-    def test_batch_estimate_order_preserved(self):
+    def test_batch_estimate_order_preserved(self, tmp_path):
         """Test that file order is preserved in batch estimation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            files = []
-            for i in range(5):
-                f = Path(tmpdir) / f"file{i}.jpg"
-                f.write_bytes(b"x" * (i + 1) * 10000)
-                files.append(str(f))
+        files = [
+            _sparse(tmp_path / f"file{i}.jpg", (i + 1) * 10000) for i in range(5)
+        ]
 
-            batch = estimate_batch_tokens(files)
+        batch = estimate_batch_tokens(files)
 
-            # Order should be preserved
-            for i, estimate in enumerate(batch.files):
-                assert f"file{i}.jpg" in estimate.source_path
+        # Order should be preserved
+        for i, estimate in enumerate(batch.files):
+            assert f"file{i}.jpg" in estimate.source_path
 
 
 class TestTokenEstimationDocumentation:
     """Tests verifying documentation claims in the module docstring."""
 
-    def test_no_llm_file_types_documented(self):
-        """Verify that documented NO_LLM file types are correctly categorized."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+    @pytest.mark.parametrize(
+        "ext, size, category",
+        [
             # These file types are documented as NO_LLM
-            no_llm_extensions = [".pdf", ".docx", ".xlsx", ".html", ".txt", ".csv"]
-
-            for ext in no_llm_extensions:
-                test_file = Path(tmpdir) / f"test{ext}"
-                test_file.write_bytes(b"x" * 100000)
-
-                estimate = estimate_file_tokens(str(test_file))
-                assert estimate.category == FileCategory.NO_LLM, f"{ext} should be NO_LLM"
-                assert estimate.total_tokens == 0, f"{ext} should have 0 tokens"
-
-    def test_image_file_types_documented(self):
-        """Verify that documented IMAGE file types are correctly categorized."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+            pytest.param(".pdf", 100000, FileCategory.NO_LLM, id="pdf"),
+            pytest.param(".docx", 100000, FileCategory.NO_LLM, id="docx"),
+            pytest.param(".xlsx", 100000, FileCategory.NO_LLM, id="xlsx"),
+            pytest.param(".html", 100000, FileCategory.NO_LLM, id="html"),
+            pytest.param(".txt", 100000, FileCategory.NO_LLM, id="txt"),
+            pytest.param(".csv", 100000, FileCategory.NO_LLM, id="csv"),
             # These file types are documented as using LLM for images
-            image_extensions = [".jpg", ".jpeg", ".png"]
-
-            for ext in image_extensions:
-                test_file = Path(tmpdir) / f"test{ext}"
-                test_file.write_bytes(b"x" * 100000)
-
-                estimate = estimate_file_tokens(str(test_file))
-                assert estimate.category == FileCategory.IMAGE, f"{ext} should be IMAGE"
-                assert estimate.total_tokens > 0, f"{ext} should have tokens > 0"
-
-    def test_pptx_file_type_documented(self):
-        """Verify that PPTX files are correctly categorized."""
-        with tempfile.TemporaryDirectory() as tmpdir:
+            pytest.param(".jpg", 100000, FileCategory.IMAGE, id="jpg"),
+            pytest.param(".jpeg", 100000, FileCategory.IMAGE, id="jpeg"),
+            pytest.param(".png", 100000, FileCategory.IMAGE, id="png"),
             # PPTX with estimated images
-            pptx_file = Path(tmpdir) / "slides.pptx"
-            pptx_file.write_bytes(b"x" * 2000000)  # 2MB
-
-            estimate = estimate_file_tokens(str(pptx_file))
-            assert estimate.category == FileCategory.PPTX
+            pytest.param(".pptx", 2000000, FileCategory.PPTX, id="pptx"),
+        ],
+    )
+    def test_documented_file_type(self, fixture_files, ext, size, category):
+        """Verify that documented file types are correctly categorized."""
+        estimate = estimate_file_tokens(fixture_files[(ext, size)])
+
+        assert estimate.category == category
+        if category is FileCategory.NO_LLM:
+            assert estimate.total_tokens == 0
+        else:
             assert estimate.total_tokens > 0
 
-
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])